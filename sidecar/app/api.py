@@ -8,6 +8,7 @@ from pathlib import Path
 import traceback
 import asyncio
 import json
+import logging
 import re
 from pydub import AudioSegment
 
@@ -26,6 +27,9 @@ from .services.sync_calculator import (
 from .services import slide_generator_async, image_fetcher_async, tagging_async
 from .utils.profiler import timeit, PerformanceProfiler, Timer
 
+# Service loggers print plain messages to the console like the rest of the sidecar
+logging.basicConfig(level=config.LOG_LEVEL, format="%(message)s")
+
 # Initialize FastAPI app
 app = FastAPI(title="LECTRA Sidecar", version="1.0.0")
 
@@ -42,6 +46,12 @@ app.add_middleware(
 job_logger = postgres.create_logger(config.DATABASE_URL)
 
 
+@app.on_event("shutdown")
+async def close_llm_sessions():
+    """Close the pooled Ollama connections of the async slide generator."""
+    await slide_generator_async.close_generators()
+
+
 class GenerateRequest(BaseModel):
     """Request model for /generate endpoint."""
     project: str
@@ -309,8 +319,12 @@ async def generate_presentation(request: PresentationRequest):
             # STEP 1: Generate outline (fast, sequential)
             with Timer("Step 1: Generate Outline"):
                 try:
-                    outline = await slide_generator_async.generate_outline_async(request.topic, lang=request.lang)
-                    slide_generator_async.save_outline(outline, project_dir / "outline.json")
+                    # Kept for the slide prompts too, so they share the outline's context
+                    web_context = await slide_generator_async.fetch_web_context_async(request.topic)
+                    outline = await slide_generator_async.generate_outline_async(
+                        request.topic, lang=request.lang, web_context=web_context
+                    )
+                    await slide_generator_async.save_outline_async(outline, project_dir / "outline.json")
                 except ConnectionError as e:
                     raise HTTPException(
                         status_code=503,
@@ -351,7 +365,9 @@ async def generate_presentation(request: PresentationRequest):
                         return await tts_engine.synthesize_slide_narration(narration_text, voice, output_mp3)
                 
                 # Stream slides and spawn immediate tasks
-                async for slide in slide_generator_async.generate_slides_streaming_async(outline, lang=request.lang):
+                async for slide in slide_generator_async.generate_slides_streaming_async(
+                    outline, lang=request.lang, web_context=web_context
+                ):
                     slide_idx = slide["slide_index"]
                     slides_data.append(slide)
                     
@@ -405,7 +421,7 @@ async def generate_presentation(request: PresentationRequest):
                     "title": outline["title"],
                     "slides": slides_data
                 }
-                slide_generator_async.save_script(script, project_dir / "script.json")
+                await slide_generator_async.save_script_async(script, project_dir / "script.json")
                 
                 # Save image metadata
                 if slide_images:
@@ -761,8 +777,12 @@ async def generate_presentation_legacy(request: PresentationRequest):
             # STEP 1: Generate outline (fast, sequential)
             with Timer("Step 1: Generate Outline"):
                 try:
-                    outline = await slide_generator_async.generate_outline_async(request.topic, lang=request.lang)
-                    slide_generator_async.save_outline(outline, project_dir / "outline.json")
+                    # Kept for the slide prompts too, so they share the outline's context
+                    web_context = await slide_generator_async.fetch_web_context_async(request.topic)
+                    outline = await slide_generator_async.generate_outline_async(
+                        request.topic, lang=request.lang, web_context=web_context
+                    )
+                    await slide_generator_async.save_outline_async(outline, project_dir / "outline.json")
                 except ConnectionError as e:
                     raise HTTPException(
                         status_code=503,
@@ -774,8 +794,8 @@ async def generate_presentation_legacy(request: PresentationRequest):
             # STEP 2: Generate full script (PARALLEL - all slides at once)
             with Timer("Step 2: Generate Script (Parallel)"):
                 try:
-                    script = await slide_generator_async.generate_full_script_async(outline)
-                    slide_generator_async.save_script(script, project_dir / "script.json")
+                    script = await slide_generator_async.generate_full_script_async(outline, web_context=web_context)
+                    await slide_generator_async.save_script_async(script, project_dir / "script.json")
                 except Exception as e:
                     raise HTTPException(status_code=500, detail=f"Script generation failed: {str(e)}")
             
@@ -15,12 +15,24 @@ class Config:
     OLLAMA_URL = os.getenv("OLLAMA_URL", "http://127.0.0.1:11434")
     OLLAMA_MODEL = "llama3.1:latest"
     
+    # Most generation requests one async generator keeps in flight at once
+    OLLAMA_MAX_INFLIGHT = int(os.getenv("OLLAMA_MAX_INFLIGHT", "4"))
+    
     # Database
     DATABASE_URL = os.getenv("DATABASE_URL", "")
     
     # Output paths
     OUTPUT_ROOT = Path(os.getenv("OUTPUT_ROOT", Path.home() / "Lectures")).expanduser()
     
+    # Cache directory for memoized network lookups (image search, etc.)
+    CACHE_DIR = Path(os.getenv("LECTRA_CACHE_DIR", Path.home() / ".cache" / "lectra")).expanduser()
+    
+    # Per-slide layout diagnostics from the PPTX builder (off by default)
+    LAYOUT_DEBUG = os.getenv("LECTRA_LAYOUT_DEBUG", "").lower() in ("1", "true", "yes")
+    
+    # Level for services that log through `logging` (DEBUG shows per-request detail)
+    LOG_LEVEL = os.getenv("LECTRA_LOG", "INFO").upper()
+    
     # FFmpeg
     FFMPEG_BIN = os.getenv("FFMPEG_BIN", "C:\\ffmpeg\\bin\\ffmpeg.exe" if os.name == 'nt' else "ffmpeg")
     
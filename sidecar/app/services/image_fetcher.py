@@ -5,9 +5,16 @@ from pathlib import Path
 from typing import List, Dict, Optional
 import hashlib
 import json
+import os
 from urllib.parse import quote
 import base64
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 try:
     from duckduckgo_search import DDGS
     DDGS_AVAILABLE = True
@@ -542,22 +549,22 @@ def download_image(url: str, output_path: Path) -> Optional[Path]:
                     # Save converted image
                     img_to_save.save(output_path, 'JPEG', quality=90)
                     # Delete temp file after successful conversion
-                    if temp_path.exists():
-                        temp_path.unlink()
+                    temp_path.unlink(missing_ok=True)
                 else:
                     # Image is already in supported format, no conversion needed
                     pass  # Will rename outside the context manager
             
-            # If no conversion was needed, rename the temp file
-            if not output_path.exists() and temp_path.exists():
-                temp_path.rename(output_path)
+            # If no conversion was needed, atomically move the temp file
+            # over the final name (replacing any file from a previous run)
+            if temp_path.exists():
+                os.replace(temp_path, output_path)
                 
         except Exception as convert_error:
             print(f"  ⚠️ Image conversion failed: {convert_error}")
             # Try to use the file as-is
-            if temp_path.exists() and not output_path.exists():
+            if temp_path.exists():
                 try:
-                    temp_path.rename(output_path)
+                    os.replace(temp_path, output_path)
                 except:
                     pass
         
@@ -685,13 +692,10 @@ def fetch_images_for_slides(
             new_filename = f"slide_{idx}_0.jpg"
             new_path = images_dir / new_filename
             
-            # Delete target if it exists (from previous run)
-            if new_path.exists():
-                new_path.unlink()
-            
-            # Rename to final name
+            # Rename to final name (os.replace overwrites any file from a
+            # previous run atomically, on Windows too)
             try:
-                old_path.rename(new_path)
+                os.replace(old_path, new_path)
                 best_image["local_path"] = str(new_path)
                 final_images.append(best_image)
                 
@@ -706,12 +710,11 @@ def fetch_images_for_slides(
             # Delete all other candidates (keep only the selected one)
             for img in downloaded[1:]:  # Skip first one (already renamed)
                 candidate_path = Path(img["local_path"])
-                if candidate_path.exists():
-                    try:
-                        candidate_path.unlink()
-                        print(f"  🗑️ Removed: {candidate_path.name}")
-                    except Exception as e:
-                        print(f"  ⚠️ Failed to delete {candidate_path.name}: {e}")
+                try:
+                    candidate_path.unlink(missing_ok=True)
+                    print(f"  🗑️ Removed: {candidate_path.name}")
+                except Exception as e:
+                    print(f"  ⚠️ Failed to delete {candidate_path.name}: {e}")
             
             slide_images[idx] = final_images
             print(f"✓ Slide {idx} has {len(final_images)} image(s)")
@@ -726,6 +729,12 @@ def fetch_images_for_slides(
 
 
 def save_image_metadata(slide_images: Dict[int, List[Dict]], output_path: Path):
-    """Save image metadata to JSON file."""
+    """Save image metadata to JSON file (serialized straight to the file handle)."""
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(slide_images, indent=2), encoding='utf-8')
+    if ORJSON_AVAILABLE:
+        with output_path.open('wb') as f:
+            f.write(orjson.dumps(slide_images, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        # Same bytes as the orjson branch: 2-space indent, UTF-8 kept as-is
+        with output_path.open('w', encoding='utf-8') as f:
+            json.dump(slide_images, f, indent=2, ensure_ascii=False)
@@ -2,18 +2,167 @@
 
 import asyncio
 import aiohttp
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List
+from typing import Callable, Dict, List, Optional
+import hashlib
 import json
+import os
+import time
 
+from ..config import config
 from .image_fetcher import (
     search_duckduckgo_images,
     search_wikimedia_commons,
     search_pixabay,
+    save_image_metadata,
     DDGS_AVAILABLE
 )
 
 
+# Image search results are memoized in-process (LRU) and on disk so repeated
+# queries across slides and reruns skip the search API round-trips
+SEARCH_CACHE_MAX_ENTRIES = 256
+SEARCH_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+_search_cache: "OrderedDict[tuple, List[Dict]]" = OrderedDict()
+
+
+def _search_cache_path(source_name: str, query: str, max_results: int) -> Path:
+    """On-disk cache file for a search query."""
+    key = hashlib.sha1(f"{source_name}|{max_results}|{query}".encode('utf-8')).hexdigest()
+    return config.CACHE_DIR / "img_search" / f"{key}.json"
+
+
+def _read_search_cache(path: Path) -> Optional[List[Dict]]:
+    """Read cached search results, ignoring missing or expired entries."""
+    try:
+        if time.time() - path.stat().st_mtime > SEARCH_CACHE_TTL_SECONDS:
+            return None
+        return json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
+
+
+def _write_search_cache(path: Path, images: List[Dict]):
+    """Persist search results; cache write failures are non-fatal."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(images), encoding='utf-8')
+    except OSError as e:
+        print(f"  ⚠️ Failed to write image search cache: {e}")
+
+
+async def _cached_search(source_fn: Callable[[str, int], List[Dict]], query: str, max_results: int) -> List[Dict]:
+    """
+    Run an image search through the memory and disk caches.
+    
+    Only non-empty results are cached so transient API failures are retried.
+    Returns copies of the cached dicts since callers annotate them in place.
+    """
+    key = (source_fn.__name__, query, max_results)
+    
+    images = _search_cache.get(key)
+    if images is not None:
+        _search_cache.move_to_end(key)
+    else:
+        cache_path = _search_cache_path(source_fn.__name__, query, max_results)
+        images = await asyncio.to_thread(_read_search_cache, cache_path)
+        
+        if images is None:
+            images = await asyncio.to_thread(source_fn, query, max_results)
+            if not images:
+                return []
+            await asyncio.to_thread(_write_search_cache, cache_path, images)
+        else:
+            print(f"  ♻️ Using cached {source_fn.__name__} results for: {query}")
+        
+        _search_cache[key] = images
+        if len(_search_cache) > SEARCH_CACHE_MAX_ENTRIES:
+            _search_cache.popitem(last=False)
+    
+    return [dict(img) for img in images]
+
+
+async def _fetch_image_bytes(session: aiohttp.ClientSession, url: str) -> Optional[bytes]:
+    """
+    Fetch raw image bytes, returning None on a non-200 response or error.
+    
+    Cancelling the task aborts the request and closes the connection.
+    """
+    try:
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+            if response.status == 200:
+                return await response.read()
+            return None
+    except Exception as e:
+        print(f"  ⚠️ Download failed for {url}: {e}")
+        return None
+
+
+def _save_image(content: bytes, output_path: Path) -> bool:
+    """
+    Write downloaded image bytes to output_path, converting WEBP and other
+    unsupported formats to JPEG.
+    
+    Returns:
+        True if the image was saved, False otherwise
+    """
+    try:
+        # Save to temporary file first
+        temp_path = output_path.with_suffix('.tmp')
+        temp_path.write_bytes(content)
+        
+        # Check if image is WEBP and convert to JPEG
+        try:
+            from PIL import Image
+            
+            with Image.open(temp_path) as img:
+                # Convert WEBP or any unsupported format to JPEG
+                if img.format == 'WEBP' or img.format not in ['JPEG', 'JPG', 'PNG', 'GIF', 'BMP']:
+                    print(f"  ⚙️ Converting {img.format} to JPEG...")
+                    # Convert to RGB if needed (for transparency)
+                    if img.mode in ('RGBA', 'LA', 'P'):
+                        background = Image.new('RGB', img.size, (255, 255, 255))
+                        if img.mode == 'P':
+                            img_rgba = img.convert('RGBA')
+                            background.paste(img_rgba, mask=img_rgba.split()[-1])
+                        else:
+                            background.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
+                        img_to_save = background
+                    elif img.mode != 'RGB':
+                        img_to_save = img.convert('RGB')
+                    else:
+                        img_to_save = img.copy()
+                    
+                    # Save converted image
+                    img_to_save.save(output_path, 'JPEG', quality=90)
+                    # Delete temp file after successful conversion
+                    temp_path.unlink(missing_ok=True)
+                else:
+                    # No conversion needed
+                    pass
+            
+            # If no conversion was needed, move the temp file over
+            # the final name (replacing any image from a previous run)
+            if temp_path.exists():
+                os.replace(temp_path, output_path)
+                
+        except Exception as convert_error:
+            print(f"  ⚠️ Image conversion failed: {convert_error}")
+            # Try to use the file as-is
+            if temp_path.exists():
+                try:
+                    os.replace(temp_path, output_path)
+                except:
+                    pass
+        
+        return output_path.exists()
+    except Exception as e:
+        print(f"  ⚠️ Failed to save {output_path.name}: {e}")
+        return False
+
+
 async def download_image_async(session: aiohttp.ClientSession, url: str, output_path: Path) -> bool:
     """
     Download image asynchronously using aiohttp with WEBP conversion.
@@ -26,65 +175,10 @@ async def download_image_async(session: aiohttp.ClientSession, url: str, output_
     Returns:
         True if successful, False otherwise
     """
-    try:
-        async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
-            if response.status == 200:
-                content = await response.read()
-                
-                # Save to temporary file first
-                temp_path = output_path.with_suffix('.tmp')
-                temp_path.write_bytes(content)
-                
-                # Check if image is WEBP and convert to JPEG
-                try:
-                    from PIL import Image
-                    
-                    with Image.open(temp_path) as img:
-                        # Convert WEBP or any unsupported format to JPEG
-                        if img.format == 'WEBP' or img.format not in ['JPEG', 'JPG', 'PNG', 'GIF', 'BMP']:
-                            print(f"  ⚙️ Converting {img.format} to JPEG...")
-                            # Convert to RGB if needed (for transparency)
-                            if img.mode in ('RGBA', 'LA', 'P'):
-                                background = Image.new('RGB', img.size, (255, 255, 255))
-                                if img.mode == 'P':
-                                    img_rgba = img.convert('RGBA')
-                                    background.paste(img_rgba, mask=img_rgba.split()[-1])
-                                else:
-                                    background.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
-                                img_to_save = background
-                            elif img.mode != 'RGB':
-                                img_to_save = img.convert('RGB')
-                            else:
-                                img_to_save = img.copy()
-                            
-                            # Save converted image
-                            img_to_save.save(output_path, 'JPEG', quality=90)
-                            # Delete temp file after successful conversion
-                            if temp_path.exists():
-                                temp_path.unlink()
-                        else:
-                            # No conversion needed
-                            pass
-                    
-                    # If no conversion was needed, rename the temp file
-                    if not output_path.exists() and temp_path.exists():
-                        temp_path.rename(output_path)
-                        
-                except Exception as convert_error:
-                    print(f"  ⚠️ Image conversion failed: {convert_error}")
-                    # Try to use the file as-is
-                    if temp_path.exists() and not output_path.exists():
-                        try:
-                            temp_path.rename(output_path)
-                        except:
-                            pass
-                
-                return output_path.exists()
-            else:
-                return False
-    except Exception as e:
-        print(f"  ⚠️ Download failed for {url}: {e}")
+    content = await _fetch_image_bytes(session, url)
+    if content is None:
         return False
+    return _save_image(content, output_path)
 
 
 async def fetch_images_for_slide_async(
@@ -127,84 +221,59 @@ async def fetch_images_for_slide_async(
     query = enhanced_query.strip()
     print(f"Search query: {query}")
     
-    # Search multiple sources (synchronous - these are fast API calls)
+    # Search multiple sources (cached, run off the event loop)
     images = []
     
     # 1. DuckDuckGo Images (most current)
-    ddg_images = search_duckduckgo_images(query, max_results=2)
+    ddg_images = await _cached_search(search_duckduckgo_images, query, 2)
     images.extend(ddg_images)
     
     # 2. Wikimedia Commons as backup
     if len(images) < 2:
-        wiki_images = search_wikimedia_commons(query, max_results=2 - len(images))
+        wiki_images = await _cached_search(search_wikimedia_commons, query, 2 - len(images))
         images.extend(wiki_images)
     
     # 3. Pixabay as fallback
     if len(images) < 2:
-        pixabay_images = search_pixabay(query, max_results=2 - len(images))
+        pixabay_images = await _cached_search(search_pixabay, query, 2 - len(images))
         images.extend(pixabay_images)
     
-    # Download candidates in parallel
-    downloaded = []
-    if images:
-        print(f"Attempting to download {min(len(images), 2)} image candidates in parallel...")
-        
-        download_tasks = []
-        for img_idx, img in enumerate(images[:2]):
-            filename = f"slide_{slide_idx}_candidate_{img_idx}.jpg"
-            filepath = images_dir / filename
-            
-            # Create download task
-            task = download_image_async(session, img["url"], filepath)
-            download_tasks.append((task, img, filepath, img_idx))
-        
-        # Execute downloads in parallel
-        for task, img, filepath, img_idx in download_tasks:
-            success = await task
-            if success:
-                img["local_path"] = str(filepath)
-                downloaded.append(img)
-                source_info = f" from {img.get('source', 'unknown')}"
-                if img.get('source') == 'duckduckgo':
-                    source_info = f" from DuckDuckGo ({img.get('source_site', 'web')})"
-                print(f"  ✓ Candidate {img_idx + 1}{source_info}")
-            else:
-                print(f"  ✗ Candidate {img_idx + 1} download failed")
-    
-    # Pick the first successfully downloaded image
+    # Race the candidate downloads: the first one to arrive is written
+    # straight to the final filename and the rest are cancelled mid-download
     final_images = []
-    if downloaded:
-        best_image = downloaded[0]
-        old_path = Path(best_image["local_path"])
-        new_filename = f"slide_{slide_idx}_0.jpg"
-        new_path = images_dir / new_filename
+    if images:
+        filename = f"slide_{slide_idx}_0.jpg"
+        filepath = images_dir / filename
         
-        # Delete target if it exists
-        if new_path.exists():
-            new_path.unlink()
+        tasks = {
+            asyncio.create_task(_fetch_image_bytes(session, img["url"])): (img_idx, img)
+            for img_idx, img in enumerate(images[:2])
+        }
+        pending = set(tasks)
         
-        # Rename to final name
         try:
-            old_path.rename(new_path)
-            best_image["local_path"] = str(new_path)
-            final_images.append(best_image)
-            
-            source_info = f"{best_image.get('source', 'unknown')}"
-            if best_image.get('source') == 'duckduckgo':
-                source_info = f"DuckDuckGo ({best_image.get('source_site', 'web')})"
-            print(f"  ✅ SELECTED: {new_filename} from {source_info}")
-        except Exception as e:
-            print(f"  ⚠️ Failed to rename {old_path.name}: {e}")
-        
-        # Delete other candidates
-        for img in downloaded[1:]:
-            candidate_path = Path(img["local_path"])
-            if candidate_path.exists():
-                try:
-                    candidate_path.unlink()
-                except Exception as e:
-                    print(f"  ⚠️ Failed to delete {candidate_path.name}: {e}")
-        
+            while pending and not final_images:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    img_idx, img = tasks[task]
+                    content = task.result()
+                    if content is not None and _save_image(content, filepath):
+                        img["local_path"] = str(filepath)
+                        final_images.append(img)
+                        
+                        source_info = f"{img.get('source', 'unknown')}"
+                        if img.get('source') == 'duckduckgo':
+                            source_info = f"DuckDuckGo ({img.get('source_site', 'web')})"
+                        print(f"  ✅ SELECTED: {filename} from {source_info}")
+                        break
+                    else:
+                        print(f"  ✗ Candidate {img_idx + 1} download failed")
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+    
+    if final_images:
         print(f"✓ Slide {slide_idx} has {len(final_images)} image(s)")
     else:
         print(f"✗ No images for slide {slide_idx}")
@@ -264,12 +333,6 @@ async def fetch_images_for_slides_async(
     return slide_images
 
 
-def save_image_metadata(slide_images: Dict[int, List[Dict]], output_path: Path):
-    """Save image metadata to JSON file."""
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(slide_images, indent=2), encoding='utf-8')
-
-
 async def fetch_images_for_slide_standalone(
     slide: Dict,
     output_dir: Path
@@ -4,6 +4,97 @@ import requests
 import json
 from typing import Optional, Dict, List
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Pooled keep-alive client for streaming calls; HTTP/2 is negotiated when
+# the server supports it. Falls back to requests if httpx/h2 are missing.
+try:
+    import httpx
+    import h2  # noqa: F401 - required by httpx for http2=True
+    _HTTPX = httpx.Client(
+        http2=True,
+        timeout=120.0,
+        limits=httpx.Limits(max_keepalive_connections=8, max_connections=16)
+    )
+    _CONNECT_ERRORS = (requests.exceptions.ConnectionError, httpx.ConnectError)
+    _TIMEOUT_ERRORS = (requests.exceptions.Timeout, httpx.TimeoutException)
+except ImportError:
+    _HTTPX = None
+    _CONNECT_ERRORS = (requests.exceptions.ConnectionError,)
+    _TIMEOUT_ERRORS = (requests.exceptions.Timeout,)
+
+
+class _JsonObjectScanner:
+    """
+    Incremental brace-depth scanner for the first balanced {...} block.
+    
+    Text can be fed in arbitrary chunks (e.g. streamed LLM tokens); braces
+    inside JSON string literals are ignored. Once the object closes, feed()
+    returns its full text and further input is not needed.
+    """
+    
+    def __init__(self):
+        self._buf = []
+        self._started = False
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+    
+    def feed(self, chunk: str) -> Optional[str]:
+        """Consume a chunk; return the complete object text once it closes."""
+        if not self._started:
+            start = chunk.find('{')
+            if start < 0:
+                return None
+            chunk = chunk[start:]
+            self._started = True
+        
+        for i, ch in enumerate(chunk):
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == '\\':
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch == '{':
+                self._depth += 1
+            elif ch == '}':
+                self._depth -= 1
+                if self._depth == 0:
+                    self._buf.append(chunk[:i + 1])
+                    return ''.join(self._buf)
+        
+        self._buf.append(chunk)
+        return None
+
+
+def _loads(text: str):
+    """Parse JSON text, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _collect_streamed_text(lines) -> str:
+    """Join the 'response' fields of an Ollama NDJSON stream."""
+    result = []
+    for line in lines:
+        if line:
+            chunk = _loads(line)
+            if 'response' in chunk:
+                result.append(chunk['response'])
+            if chunk.get('done', False):
+                break
+    
+    return ''.join(result).strip()
+
 
 def generate_tagged(
     text: str, 
@@ -42,26 +133,21 @@ def generate_tagged(
     }
     
     try:
+        if _HTTPX is not None:
+            with _HTTPX.stream("POST", url, json=payload) as response:
+                response.raise_for_status()
+                return _collect_streamed_text(response.iter_lines())
+        
         response = requests.post(url, json=payload, stream=True, timeout=120)
         response.raise_for_status()
+        return _collect_streamed_text(response.iter_lines())
         
-        result = []
-        for line in response.iter_lines():
-            if line:
-                chunk = json.loads(line.decode('utf-8'))
-                if 'response' in chunk:
-                    result.append(chunk['response'])
-                if chunk.get('done', False):
-                    break
-        
-        return ''.join(result).strip()
-        
-    except requests.exceptions.ConnectionError:
+    except _CONNECT_ERRORS:
         raise ConnectionError(
             f"Cannot connect to Ollama at {base_url}. "
             "Please ensure Ollama is running and llama3.1:latest is pulled."
         )
-    except requests.exceptions.Timeout:
+    except _TIMEOUT_ERRORS:
         raise TimeoutError("Ollama request timed out after 120 seconds")
     except Exception as e:
         raise RuntimeError(f"Ollama API error: {str(e)}")
@@ -157,41 +243,41 @@ Create 3-6 animation steps that will make this slide engaging and interactive fo
             "top_p": 0.9,
             "num_ctx": 2048
         },
-        "stream": False
+        "stream": True
     }
     
     try:
-        response = requests.post(url, json=payload, timeout=60)
+        response = requests.post(url, json=payload, stream=True, timeout=60)
         response.raise_for_status()
         
-        result = response.json()
-        raw_text = result.get('response', '').strip()
-        
-        # Try to extract JSON from the response
-        # Handle cases where LLM adds explanation before/after JSON
-        json_start = raw_text.find('{')
-        json_end = raw_text.rfind('}') + 1
+        # Feed streamed tokens into the scanner and stop reading as soon as
+        # the first JSON object closes (LLM may add explanation after it)
+        scanner = _JsonObjectScanner()
+        json_text = None
+        try:
+            for line in response.iter_lines():
+                if line:
+                    chunk = _loads(line)
+                    json_text = scanner.feed(chunk.get('response', ''))
+                    if json_text is not None or chunk.get('done', False):
+                        break
+        finally:
+            response.close()
         
-        if json_start >= 0 and json_end > json_start:
-            json_text = raw_text[json_start:json_end]
-            animation_data = json.loads(json_text)
+        if json_text is not None:
+            animation_data = _loads(json_text)
             
             # Validate structure
             if 'steps' not in animation_data:
                 raise ValueError("Missing 'steps' key in animation data")
             
             # Ensure each step has required fields
-            for step in animation_data['steps']:
-                if 'id' not in step:
-                    step['id'] = animation_data['steps'].index(step) + 1
-                if 'action' not in step:
-                    step['action'] = 'fadeIn'
-                if 'duration' not in step:
-                    step['duration'] = 2.0
-                if 'element' not in step:
-                    step['element'] = 'text'
-                if 'hint' not in step:
-                    step['hint'] = "Pay attention to this key concept!"
+            for i, step in enumerate(animation_data['steps']):
+                step.setdefault('id', i + 1)
+                step.setdefault('action', 'fadeIn')
+                step.setdefault('duration', 2.0)
+                step.setdefault('element', 'text')
+                step.setdefault('hint', "Pay attention to this key concept!")
             
             return animation_data
         else:
@@ -2,8 +2,15 @@
 
 from pathlib import Path
 from typing import List, Dict, Optional
+import csv
 import json
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 def map_cues(
     timings: Dict,
@@ -54,15 +61,25 @@ def save_slide_cues(cues: Dict, output_dir: Path):
     
     output_dir.mkdir(parents=True, exist_ok=True)
     
-    # Save JSON
+    # Save JSON (compact - skip indent to avoid doubling serialization cost)
     json_path = output_dir / "slide_cues.json"
-    with open(json_path, 'w', encoding='utf-8') as f:
-        json.dump(cues, f, indent=2)
+    if ORJSON_AVAILABLE:
+        json_path.write_bytes(orjson.dumps(cues))
+    else:
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(cues, f, separators=(',', ':'), ensure_ascii=False)  # same bytes as orjson
+    
+    # Flatten slides/bullets (see map_cues example structure) into CSV rows
+    rows = [
+        (slide.get("slide_num"), bullet_idx, bullet.get("text", ""), bullet.get("start"), bullet.get("end"))
+        for slide in cues.get("slides", [])
+        for bullet_idx, bullet in enumerate(slide.get("bullets", []), start=1)
+    ]
     
-    # Save CSV (placeholder)
     csv_path = output_dir / "slide_cues.csv"
-    with open(csv_path, 'w', encoding='utf-8') as f:
-        f.write("slide,bullet,text,start,end\n")
-        # TODO: Write actual data
+    with open(csv_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+        writer = csv.writer(f)
+        writer.writerow(["slide", "bullet", "text", "start", "end"])
+        writer.writerows(rows)
     
     return json_path, csv_path
@@ -1,16 +1,246 @@
 """Quiz generation service using Ollama for interactive study mode."""
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import logging
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+logger = logging.getLogger(__name__)
+
+# Markdown code fence around the model's JSON (```json ... ``` or ``` ... ```)
+_FENCE_RE = re.compile(r'```(?:json)?\s*(.*?)```', re.DOTALL)
+
+# Keep-alive session shared by the default generator and any caller-built
+# QuizGenerator (e.g. api.py's MCQ endpoint makes one per request), so every
+# quiz request reuses the same pooled connections to Ollama.
+_SESSION = requests.Session()
+_SESSION.mount('http://', HTTPAdapter(
+    pool_connections=2,
+    pool_maxsize=4,
+    max_retries=Retry(total=2, backoff_factor=0.2)  # connection failures only; POSTs aren't replayed
+))
+_SESSION.headers['Connection'] = 'keep-alive'
+
+_QUIZ_MODEL = "llama3.2:3b"
+
+# How long Ollama keeps the quiz model loaded between checkpoints, so a
+# student's next quiz doesn't pay the model load again
+OLLAMA_KEEP_ALIVE = "30m"
+# A warm-up newer than this is trusted to have the model still loaded
+_WARM_UP_TTL_SECONDS = 25 * 60
+
+# Runs model warm-ups without blocking the caller
+_BACKGROUND = ThreadPoolExecutor(max_workers=1, thread_name_prefix="quiz-bg")
+
+
+# Fixed part of the quiz prompt. It leads the prompt so every request shares
+# the same prefix (Ollama reuses the KV cache for a matching prompt prefix).
+_QUIZ_PROMPT_PREFIX = """You are an expert educational quiz generator. Create multiple-choice questions based on the lecture content given at the end of this prompt.
+
+REQUIREMENTS:
+- Each question has 4 options (A, B, C, D)
+- Only ONE correct answer per question
+- Include detailed explanations for why each option is correct/incorrect
+- Questions should test understanding, not just memorization
+- Follow the QUIZ SETTINGS below for question count, difficulty and language
+
+CRITICAL: Respond ONLY with the JSON array. Do not include any introductory text, explanations, or markdown code blocks.
+
+FORMAT YOUR RESPONSE EXACTLY AS (JUST THE JSON ARRAY, NOTHING ELSE):
+[
+  {
+    "question": "What is the main concept discussed in slide 2?",
+    "options": {
+      "A": "Option text here",
+      "B": "Option text here", 
+      "C": "Option text here",
+      "D": "Option text here"
+    },
+    "correct_answer": "B",
+    "explanation": "B is correct because... A is wrong because... C is wrong because... D is wrong because...",
+    "hint": "Think about the key relationship mentioned in the slides",
+    "difficulty": "medium",
+    "slide_reference": 2
+  }
+]
+
+"""
+
+_DIFFICULTY_GUIDELINES = {
+    "easy": "Focus on basic recall and simple concepts",
+    "medium": "Test understanding and application of concepts",
+    "hard": "Require analysis, synthesis, and critical thinking"
+}
+
+
+@lru_cache(maxsize=32)
+def _quiz_settings_block(num_questions: int, difficulty: str, lang: str) -> str:
+    """Per-quiz settings section of the prompt (few distinct combinations, memoized)."""
+    lines = [
+        "QUIZ SETTINGS:",
+        f"- {num_questions} questions total",
+        f"- Difficulty: {difficulty} ({_DIFFICULTY_GUIDELINES.get(difficulty, '')})",
+        f"- Set \"difficulty\" to \"{difficulty}\" in every question",
+    ]
+    
+    # Language-specific instructions
+    if lang == "hi":
+        lines.append(
+            "- IMPORTANT: Generate ALL quiz questions, options, explanations, and hints in HINDI "
+            "language (Devanagari script). The questions should be natural Hindi, not English "
+            "transliterated to Devanagari."
+        )
+    
+    return "\n".join(lines) + "\n\n"
+
+
+# Lecture content allowed into the prompt, in tokens. Sized for the smallest
+# Ollama default context (2048): the fixed prompt takes ~450 tokens and five
+# MCQs ~800, leaving roughly this much for the content itself.
+_CONTENT_TOKEN_BUDGET = 800
+
+# Byte-level BPE averages ~4 UTF-8 bytes per token for English and for
+# Devanagari (3 bytes per character), so bytes/4 is a workable estimate
+_BYTES_PER_TOKEN = 4
+
+_SENTENCE_ENDS = ("\n", ". ", "? ", "! ", "।")
+
+
+@lru_cache(maxsize=32)
+def _trim_to_token_budget(text: str, max_tokens: int = _CONTENT_TOKEN_BUDGET) -> str:
+    """
+    Trim text to roughly max_tokens, cutting at a sentence boundary.
+    
+    Memoized, so regenerating a quiz for the same slides skips the
+    re-encode.
+    
+    Args:
+        text: Text to trim
+        max_tokens: Estimated token budget
+        
+    Returns:
+        The text unchanged if it fits, else its longest prefix that fits and
+        ends at a sentence (or failing that, word) boundary
+    """
+    max_bytes = max_tokens * _BYTES_PER_TOKEN
+    data = text.encode("utf-8")
+    if len(data) <= max_bytes:
+        return text
+    
+    head = data[:max_bytes].decode("utf-8", "ignore")
+    
+    # Prefer ending on a full sentence, as long as that keeps most of the budget
+    cut = max(head.rfind(end) + len(end) for end in _SENTENCE_ENDS)
+    if cut < len(head) // 2:
+        cut = head.rfind(" ")
+    return head[:cut].rstrip() if cut > 0 else head
+
+
+# Fields every generated MCQ must carry, and the allowed answer letters
+_MCQ_REQUIRED_FIELDS = frozenset(("question", "options", "correct_answer", "explanation"))
+_MCQ_ANSWER_KEYS = frozenset("ABCD")
+
+
+def _loads(data):
+    """Parse JSON text or bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+class _ArrayObjectScanner:
+    """
+    Incremental scanner for the objects of the first top-level JSON array.
+    
+    Streamed LLM tokens are fed in arbitrary chunks; braces and brackets
+    inside JSON string literals are ignored. feed() returns the text of every
+    array element object that closed within the chunk.
+    """
+    
+    def __init__(self):
+        self._obj = []
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+    
+    def feed(self, chunk: str) -> List[str]:
+        """Consume a chunk; return the complete element objects it closed."""
+        if self._depth == 0:
+            start = chunk.find('[')
+            if start < 0:
+                return []
+            chunk = chunk[start:]
+        
+        closed = []
+        for ch in chunk:
+            if self._depth >= 2:
+                self._obj.append(ch)
+            
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == '\\':
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch in '[{':
+                self._depth += 1
+                if self._depth == 2:
+                    self._obj = [ch]
+            elif ch in ']}':
+                self._depth -= 1
+                if self._depth == 1:
+                    closed.append(''.join(self._obj))
+                    self._obj = []
+                elif self._depth == 0:
+                    break  # Array finished
+        
+        return closed
+
 
 class QuizGenerator:
     """Generates MCQs from slide content using Ollama."""
     
-    def __init__(self, ollama_url: str = "http://localhost:11434"):
+    def __init__(self, ollama_url: str = "http://localhost:11434", session: Optional[requests.Session] = None):
         self.ollama_url = ollama_url
+        self._session = session or _SESSION
+        self._gen_url = f"{ollama_url}/api/generate"
+        self._warm_until = 0.0  # monotonic time until which the model is assumed loaded
+    
+    def warm_up(self):
+        """
+        Ask Ollama to load the quiz model (a request with no prompt only loads it).
+        
+        Skipped while an earlier warm-up is recent enough that the model is
+        still within its keep-alive, so back-to-back quizzes send one request.
+        """
+        if time.monotonic() < self._warm_until:
+            return
+        try:
+            self._session.post(
+                self._gen_url,
+                json={"model": _QUIZ_MODEL, "keep_alive": OLLAMA_KEEP_ALIVE},
+                timeout=60
+            ).raise_for_status()
+        except requests.RequestException:
+            return  # generate_mcqs will report connection problems
+        self._warm_until = time.monotonic() + _WARM_UP_TTL_SECONDS
     
     def generate_mcqs(
         self,
@@ -34,58 +264,74 @@ class QuizGenerator:
             List of MCQ dictionaries with question, options, correct_answer, explanation
         """
         
-        print(f"\n--- QuizGenerator.generate_mcqs ---")
-        print(f"Titles: {slide_titles}")
-        print(f"Num questions: {num_questions}")
-        print(f"Difficulty: {difficulty}")
-        print(f"Language: {lang}")
+        logger.debug("generate_mcqs: %d questions, difficulty=%s, lang=%s, titles=%s",
+                     num_questions, difficulty, lang, slide_titles)
         
         # Craft prompt for Ollama
         prompt = self._build_quiz_prompt(slide_content, slide_titles, num_questions, difficulty, lang)
         
-        print(f"Prompt length: {len(prompt)} chars")
-        print(f"Calling Ollama at {self.ollama_url}...")
+        logger.debug("Prompt length: %d chars; calling Ollama at %s", len(prompt), self.ollama_url)
         
         try:
-            response = requests.post(
-                f"{self.ollama_url}/api/generate",
+            # Stream tokens and stop as soon as enough valid MCQs have closed,
+            # so Ollama doesn't keep decoding questions we'd slice off anyway
+            with self._session.post(
+                self._gen_url,
                 json={
-                    "model": "llama3.2:3b",
+                    "model": _QUIZ_MODEL,
                     "prompt": prompt,
-                    "stream": False,
+                    "stream": True,
+                    "keep_alive": OLLAMA_KEEP_ALIVE,
                     "options": {
                         "temperature": 0.7,
                         "top_p": 0.9
                     }
                 },
+                stream=True,
                 timeout=120
-            )
-            
-            print(f"Ollama response status: {response.status_code}")
-            
-            if response.status_code == 200:
-                result = response.json()
-                response_text = result.get("response", "")
-                print(f"Ollama response length: {len(response_text)} chars")
-                print(f"Response preview: {response_text[:200]}...")
+            ) as response:
+                if response.status_code != 200:
+                    logger.warning("✗ Ollama API error %d, falling back to simple MCQs: %s",
+                                   response.status_code, response.text)
+                    return self._generate_fallback_mcqs(slide_titles, num_questions)
                 
-                mcqs = self._parse_mcqs(response_text)
-                print(f"Parsed {len(mcqs)} MCQs from response")
+                scanner = _ArrayObjectScanner()
+                tokens = []
+                mcqs = []
                 
-                final_mcqs = mcqs[:num_questions]
-                print(f"Returning {len(final_mcqs)} MCQs")
-                return final_mcqs
-            else:
-                print(f"✗ Ollama API error: {response.status_code}")
-                print(f"Response: {response.text}")
-                print("Falling back to simple MCQs")
-                return self._generate_fallback_mcqs(slide_titles, num_questions)
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    data = _loads(line)
+                    token = data.get("response", "")
+                    tokens.append(token)
+                    
+                    for obj_text in scanner.feed(token):
+                        try:
+                            mcq = _loads(obj_text)
+                        except json.JSONDecodeError:
+                            continue
+                        if self._validate_mcq(mcq):
+                            mcqs.append(mcq)
+                    
+                    if len(mcqs) >= num_questions or data.get("done"):
+                        break
+            
+            response_text = "".join(tokens)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Ollama response: %d chars, preview: %s...", len(response_text), response_text[:200])
+            
+            # Stream ended short (e.g. output wasn't a bare array): parse it whole
+            if len(mcqs) < num_questions:
+                parsed = self._parse_mcqs(response_text)
+                if len(parsed) > len(mcqs):
+                    mcqs = parsed
+            logger.debug("Parsed %d MCQs from response", len(mcqs))
+            
+            return mcqs[:num_questions]
                 
         except Exception as e:
-            print(f"✗ Quiz generation exception: {e}")
-            import traceback
-            traceback.print_exc()
-            print("Falling back to simple MCQs")
+            logger.exception("✗ Quiz generation failed, falling back to simple MCQs: %s", e)
             return self._generate_fallback_mcqs(slide_titles, num_questions)
     
     def _build_quiz_prompt(
@@ -96,74 +342,31 @@ class QuizGenerator:
         difficulty: str,
         lang: str = "en"
     ) -> str:
-        """Build the prompt for Ollama to generate MCQs."""
-        
-        difficulty_guidelines = {
-            "easy": "Focus on basic recall and simple concepts",
-            "medium": "Test understanding and application of concepts",
-            "hard": "Require analysis, synthesis, and critical thinking"
-        }
-        
-        # Language-specific instructions
-        language_instruction = ""
-        if lang == "hi":
-            language_instruction = "\n\nIMPORTANT: Generate ALL quiz questions, options, explanations, and hints in HINDI language (Devanagari script). The questions should be natural Hindi, not English transliterated to Devanagari."
+        """
+        Build the prompt for Ollama to generate MCQs.
         
-        prompt = f"""You are an expert educational quiz generator. Create {num_questions} multiple-choice questions based on this lecture content.
-{language_instruction}
-
-LECTURE TOPICS:
-{chr(10).join(f"- {title}" for title in titles)}
-
-CONTENT:
-{content[:3000]}  
-
-REQUIREMENTS:
-- Difficulty: {difficulty} ({difficulty_guidelines.get(difficulty, '')})
-- {num_questions} questions total
-- Each question has 4 options (A, B, C, D)
-- Only ONE correct answer per question
-- Include detailed explanations for why each option is correct/incorrect
-- Questions should test understanding, not just memorization
-{"- ALL text must be in HINDI (Devanagari script)" if lang == "hi" else ""}
-
-CRITICAL: Respond ONLY with the JSON array. Do not include any introductory text, explanations, or markdown code blocks.
-
-FORMAT YOUR RESPONSE EXACTLY AS (JUST THE JSON ARRAY, NOTHING ELSE):
-[
-  {{
-    "question": "What is the main concept discussed in slide 2?",
-    "options": {{
-      "A": "Option text here",
-      "B": "Option text here", 
-      "C": "Option text here",
-      "D": "Option text here"
-    }},
-    "correct_answer": "B",
-    "explanation": "B is correct because... A is wrong because... C is wrong because... D is wrong because...",
-    "hint": "Think about the key relationship mentioned in the slides",
-    "difficulty": "{difficulty}",
-    "slide_reference": 2
-  }}
-]
-
-Generate ONLY the JSON array now (no other text):"""
+        The fixed instructions and format come first and the slide content
+        last, so consecutive quizzes share a byte-identical prompt prefix that
+        Ollama can reuse from its KV cache instead of re-running prefill.
+        """
+        titles_block = "\n".join(f"- {title}" for title in titles)
         
-        return prompt
+        return (
+            f"{_QUIZ_PROMPT_PREFIX}"
+            f"{_quiz_settings_block(num_questions, difficulty, lang)}"
+            f"LECTURE TOPICS:\n{titles_block}\n\n"
+            f"CONTENT:\n{_trim_to_token_budget(content)}\n\n"
+            f"Generate ONLY the JSON array now (no other text):"
+        )
     
     def _parse_mcqs(self, response_text: str) -> List[Dict[str, Any]]:
         """Parse Ollama's response into structured MCQ format."""
         
         try:
             # Extract JSON from markdown code blocks if present
-            if "```json" in response_text:
-                json_start = response_text.find("```json") + 7
-                json_end = response_text.find("```", json_start)
-                json_text = response_text[json_start:json_end].strip()
-            elif "```" in response_text:
-                json_start = response_text.find("```") + 3
-                json_end = response_text.find("```", json_start)
-                json_text = response_text[json_start:json_end].strip()
+            fence = _FENCE_RE.search(response_text)
+            if fence:
+                json_text = fence.group(1).strip()
             else:
                 # No code blocks - try to find JSON array directly
                 # Look for the first [ and last ]
@@ -176,7 +379,7 @@ Generate ONLY the JSON array now (no other text):"""
                     json_text = response_text.strip()
             
             # Parse JSON
-            mcqs = json.loads(json_text)
+            mcqs = _loads(json_text)
             
             # Validate structure
             validated_mcqs = []
@@ -187,32 +390,26 @@ Generate ONLY the JSON array now (no other text):"""
             return validated_mcqs
             
         except json.JSONDecodeError as e:
-            print(f"JSON parsing error: {e}")
-            print(f"Response text: {response_text[:500]}")
+            logger.warning("MCQ JSON parsing error: %s", e)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Response text: %s", response_text[:500])
             return []
     
     def _validate_mcq(self, mcq: Dict[str, Any]) -> bool:
         """Validate MCQ structure."""
-        required_fields = ["question", "options", "correct_answer", "explanation"]
-        
-        if not all(field in mcq for field in required_fields):
-            return False
-        
-        if not isinstance(mcq["options"], dict):
-            return False
-        
-        if len(mcq["options"]) != 4:
-            return False
-        
-        if mcq["correct_answer"] not in ["A", "B", "C", "D"]:
-            return False
-        
-        return True
+        return (
+            isinstance(mcq, dict)
+            and _MCQ_REQUIRED_FIELDS <= mcq.keys()
+            and isinstance(mcq["options"], dict)
+            and len(mcq["options"]) == 4
+            and isinstance(mcq["correct_answer"], str)  # set lookup needs a hashable value
+            and mcq["correct_answer"] in _MCQ_ANSWER_KEYS
+        )
     
     def _generate_fallback_mcqs(self, titles: List[str], num_questions: int) -> List[Dict[str, Any]]:
         """Generate simple fallback MCQs if Ollama fails."""
         
-        print(f"\n⚠️ Generating {num_questions} fallback MCQs...")
+        logger.warning("⚠️ Generating %d fallback MCQs", num_questions)
         
         fallback_mcqs = []
         for i in range(min(num_questions, len(titles))):
@@ -249,7 +446,7 @@ Generate ONLY the JSON array now (no other text):"""
                 "slide_reference": 1
             })
         
-        print(f"✓ Generated {len(fallback_mcqs)} fallback MCQs")
+        logger.debug("Generated %d fallback MCQs", len(fallback_mcqs))
         return fallback_mcqs
         return fallback_mcqs
     
@@ -268,25 +465,26 @@ Generate ONLY the JSON array now (no other text):"""
         Returns:
             List of slide numbers (0-indexed) that should trigger quizzes
         """
-        checkpoints = []
-        current = checkpoint_interval
-        
-        while current < total_slides:
-            checkpoints.append(current)
-            current += checkpoint_interval
+        checkpoints = list(range(checkpoint_interval, total_slides, checkpoint_interval))
         
         # Always add a final checkpoint if not already present
-        if total_slides > checkpoint_interval and (total_slides - 1) not in checkpoints:
-            checkpoints.append(total_slides - 1)
+        last = total_slides - 1
+        if total_slides > checkpoint_interval and checkpoints[-1] != last:
+            checkpoints.append(last)
         
         return checkpoints
 
 
+# Generator used when callers don't pass one (it holds no per-quiz state)
+_DEFAULT_GENERATOR = QuizGenerator()
+
+
 def generate_quiz_for_slides(
     project_path: Path,
     slide_range: tuple[int, int],
     num_questions: int = 5,
-    difficulty: str = "medium"
+    difficulty: str = "medium",
+    generator: Optional[QuizGenerator] = None
 ) -> Dict[str, Any]:
     """
     Generate a quiz for a specific range of slides.
@@ -296,60 +494,66 @@ def generate_quiz_for_slides(
         slide_range: (start_slide, end_slide) tuple (0-indexed)
         num_questions: Number of MCQs to generate
         difficulty: Quiz difficulty level
+        generator: Optional QuizGenerator to use (defaults to a shared instance)
         
     Returns:
         Dictionary with quiz data and metadata
     """
     
-    print(f"\n--- Generate Quiz For Slides ---")
-    print(f"Project: {project_path}")
-    print(f"Slide range: {slide_range}")
+    logger.debug("generate_quiz_for_slides: project=%s, slide range=%s", project_path, slide_range)
+    
+    if generator is None:
+        generator = _DEFAULT_GENERATOR
     
     # Load presentation metadata
     metadata_path = project_path / "metadata.json"
     if not metadata_path.exists():
-        print(f"✗ Metadata not found: {metadata_path}")
+        logger.error("✗ Metadata not found: %s", metadata_path)
         raise FileNotFoundError(f"Metadata not found: {metadata_path}")
     
-    print(f"✓ Loading metadata from {metadata_path}")
+    logger.debug("Loading metadata from %s", metadata_path)
     
-    with open(metadata_path, 'r', encoding='utf-8') as f:
-        metadata = json.load(f)
+    metadata = _loads(metadata_path.read_bytes())
     
     # Detect language from metadata
     lang = metadata.get("lang", "en")
-    print(f"Language: {lang}")
     
     # Extract slide content from range
     slides = metadata.get("slides", [])
     start, end = slide_range
     
-    print(f"Total slides in metadata: {len(slides)}")
-    print(f"Requested range: {start} to {end}")
+    logger.debug("Language: %s, slides in metadata: %d, requested range: %d to %d", lang, len(slides), start, end)
     
     if start < 0 or end >= len(slides):
-        print(f"✗ Invalid slide range: {slide_range} (total slides: {len(slides)})")
+        logger.error("✗ Invalid slide range: %s (total slides: %d)", slide_range, len(slides))
         raise ValueError(f"Invalid slide range: {slide_range} (total slides: {len(slides)})")
     
+    # Request is valid: load the model while the slide content is assembled
+    _BACKGROUND.submit(generator.warm_up)
+    
     target_slides = slides[start:end + 1]
-    print(f"Extracted {len(target_slides)} slides for quiz")
     
-    # Combine content
-    slide_titles = [slide.get("title", f"Slide {i+start+1}") for i, slide in enumerate(target_slides)]
-    slide_content = "\n\n".join([
-        f"Slide {i+start+1}: {slide.get('title', '')}\n{slide.get('content', '')}"
-        for i, slide in enumerate(target_slides)
-    ])
+    # Combine titles and content in one pass. Content beyond what the prompt
+    # can hold (_trim_to_token_budget) is never formatted or joined.
+    content_limit = _CONTENT_TOKEN_BUDGET * _BYTES_PER_TOKEN  # chars <= UTF-8 bytes
+    slide_titles = []
+    parts = []
+    content_length = -2  # length of "\n\n".join(parts)
+    for n, slide in enumerate(target_slides, start + 1):
+        title = slide.get("title", "")
+        slide_titles.append(title or f"Slide {n}")
+        if content_length <= content_limit:
+            part = f"Slide {n}: {title}\n{slide.get('content', '')}"
+            parts.append(part)
+            content_length += len(part) + 2
+    slide_content = "\n\n".join(parts)
     
-    print(f"Slide titles: {slide_titles}")
-    print(f"Content length: {len(slide_content)} chars")
+    logger.debug("Quiz over %d slides, %d content chars: %s", len(target_slides), len(slide_content), slide_titles)
     
     # Generate quiz with language support
-    print(f"Calling QuizGenerator with {num_questions} questions, difficulty: {difficulty}")
-    generator = QuizGenerator()
     mcqs = generator.generate_mcqs(slide_content, slide_titles, num_questions, difficulty, lang)
     
-    print(f"✓ Generated {len(mcqs)} MCQs")
+    logger.info("✓ Generated %d MCQs for slides %d-%d", len(mcqs), start, end)
     
     quiz_data = {
         "slide_range": slide_range,
@@ -361,5 +565,4 @@ def generate_quiz_for_slides(
         "checkpoint_id": f"quiz_{start}_{end}"
     }
     
-    print(f"--- Quiz Generation Complete ---\n")
     return quiz_data
@@ -2,21 +2,305 @@
 
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from copy import deepcopy
+from functools import lru_cache
 from typing import Dict, List, Optional
 from pathlib import Path
+import hashlib
+import importlib.util
+import os
+import threading
+import time
+import unicodedata
+
+from ..config import config
 
 try:
-    from duckduckgo_search import DDGS
-    DDGS_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    DDGS_AVAILABLE = False
+    ORJSON_AVAILABLE = False
+
+# duckduckgo_search pulls in httpx/lxml, so only check that it is installed
+# here and import it on the first web search
+DDGS_AVAILABLE = importlib.util.find_spec("duckduckgo_search") is not None
+if not DDGS_AVAILABLE:
     print("⚠️ duckduckgo_search not available - presentations will use only LLM knowledge")
 
+# Keep-alive session shared by the outline and all slide-content calls, so a
+# deck reuses a few sockets instead of opening one per request
+_SESSION = requests.Session()
+_SESSION.mount('http://', HTTPAdapter(
+    pool_connections=2,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.2)  # connection failures only; POSTs aren't replayed
+))
+
+# How long Ollama keeps the model (and its prompt-prefix KV cache) loaded
+# between the outline and slide-content calls, and between decks
+OLLAMA_KEEP_ALIVE = "30m"
+
+# Context window for every call on the slide model, including the warm-up:
+# Ollama reloads the model whenever num_ctx changes, so it is one fixed value
+# sized for the largest prompt (slide prompt with outline and web context)
+# plus a batched response, rather than the model's multi-thousand default
+OLLAMA_NUM_CTX = 4096
+
+# Output cap for one slide's content in English. The outline is uncapped
+# (num_predict -1, bounded by num_ctx) since it also writes the first slides'
+# content; a capped response that still gets cut off is retried once uncapped.
+SLIDE_NUM_PREDICT = 512
+UNCAPPED_NUM_PREDICT = -1
+
+# Devanagari takes several times more tokens than English for the same text
+_NUM_PREDICT_LANG_SCALE = {"hi": 3}
+
+# Parsed LLM responses are memoized in-process (LRU) and on disk, keyed by the
+# full request payload, so regenerating a slide or retrying an identical
+# request skips the Ollama call
+LLM_CACHE_MAX_ENTRIES = 256
+LLM_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+_llm_cache: "OrderedDict[str, Dict]" = OrderedDict()
+_llm_cache_lock = threading.Lock()  # generate_full_script calls in from worker threads
+
+
+def _loads(data):
+    """Parse JSON text or bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_json(obj, output_path: Path):
+    """
+    Write pretty-printed UTF-8 JSON, keeping non-ASCII text (Hindi) as-is.
+    
+    Written to a temp file and renamed into place, so a crash mid-write never
+    leaves a truncated outline or script behind.
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    if ORJSON_AVAILABLE:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        data = json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    
+    # Per-thread temp name: LLM cache entries can be written from worker threads
+    temp_path = output_path.with_suffix(f"{output_path.suffix}.{threading.get_ident()}.tmp")
+    try:
+        temp_path.write_bytes(data)
+        os.replace(temp_path, output_path)
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
+def _slide_num_predict(lang: str, slides: int = 1) -> int:
+    """Output cap for a request producing content for `slides` slides in `lang`."""
+    return SLIDE_NUM_PREDICT * _NUM_PREDICT_LANG_SCALE.get(lang, 1) * slides
+
+
+def _is_truncated(payload: Dict, result: Dict) -> bool:
+    """Whether a capped request stopped at its num_predict limit."""
+    return (result.get("done_reason") == "length"
+            and payload["options"].get("num_predict", UNCAPPED_NUM_PREDICT) != UNCAPPED_NUM_PREDICT)
+
+
+def _uncapped(payload: Dict) -> Dict:
+    """The same /api/generate payload without the output cap."""
+    return {**payload, "options": {**payload["options"], "num_predict": UNCAPPED_NUM_PREDICT}}
+
+
+def _generate(payload: Dict, ollama_url: str) -> Dict:
+    """
+    POST /api/generate and decode the result.
+    
+    A response cut off by num_predict would be unparseable JSON, so it is
+    requested once more without the cap.
+    
+    Raises:
+        requests.RequestException: HTTP or connection failure
+        ConnectionError: The body was not JSON (proxy error page, truncated read)
+    """
+    for request_payload in (payload, _uncapped(payload)):
+        response = _SESSION.post(
+            f"{ollama_url}/api/generate",
+            json=request_payload,
+            timeout=60
+        )
+        response.raise_for_status()
+        
+        try:
+            result = _loads(response.content)
+        except ValueError as e:
+            raise ConnectionError(f"Ollama returned an invalid response: {e}")
+        
+        if not _is_truncated(request_payload, result):
+            break
+        print("⚠️ Response hit the num_predict cap, retrying without it")
+    return result
+
+
+def _llm_cache_key(payload: Dict) -> str:
+    """Cache key for an /api/generate payload (model, system, prompt and options)."""
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+def _get_cached_response(key: str) -> Optional[Dict]:
+    """Look up a parsed response in the memory cache, then on disk."""
+    with _llm_cache_lock:
+        value = _llm_cache.get(key)
+        if value is not None:
+            _llm_cache.move_to_end(key)
+            return deepcopy(value)
+    
+    path = config.CACHE_DIR / "llm" / f"{key}.json"
+    try:
+        if time.time() - path.stat().st_mtime > LLM_CACHE_TTL_SECONDS:
+            return None
+        value = _loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    
+    print("♻️ Using cached LLM response")
+    _remember_response(key, value)
+    return deepcopy(value)
+
+
+def _remember_response(key: str, value: Dict):
+    """Add a parsed response to the in-process LRU."""
+    with _llm_cache_lock:
+        _llm_cache[key] = value
+        if len(_llm_cache) > LLM_CACHE_MAX_ENTRIES:
+            _llm_cache.popitem(last=False)
+
+
+def _cache_response(key: str, value: Dict):
+    """Store a parsed response in memory and on disk; disk failures are non-fatal."""
+    _remember_response(key, deepcopy(value))
+    path = config.CACHE_DIR / "llm" / f"{key}.json"
+    try:
+        # Atomic, so threads reading the cache never see a partial entry
+        _write_json(value, path)
+    except OSError as e:
+        print(f"⚠️ Failed to write LLM response cache: {e}")
+
+
+def _canonical_text(text: str) -> str:
+    """
+    Normalize user-supplied prompt fields (topic, slide title).
+    
+    NFC-composes Unicode (Devanagari typed via different IMEs can differ in
+    code points) and collapses whitespace, so inputs that only differ in those
+    produce byte-identical prompts and hit the same cache entries.
+    """
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _extract_json(text: str, opener: str = '{'):
+    """
+    Decode the first JSON value in an LLM response.
+    
+    Tries each '{' (or '[') in turn with JSONDecoder.raw_decode, which stops
+    at the end of the value, so surrounding prose, code fences or a second
+    JSON block after it are ignored.
+    
+    Args:
+        text: Raw response text
+        opener: '{' for an object, '[' for an array
+        
+    Returns:
+        The decoded value
+        
+    Raises:
+        json.JSONDecodeError: Candidates were found but none decoded
+        ValueError: The text contains no candidate at all
+    """
+    first_error = None
+    idx = text.find(opener)
+    while idx != -1:
+        try:
+            return _JSON_DECODER.raw_decode(text, idx)[0]
+        except json.JSONDecodeError as e:
+            first_error = first_error or e
+            idx = text.find(opener, idx + 1)
+    
+    if first_error is not None:
+        raise first_error
+    raise ValueError(f"No JSON {'object' if opener == '{' else 'array'} found in response: {text}")
+
+
+def _parse_llm_json(text: str) -> Dict:
+    """
+    Decode a JSON-mode ("format": "json") Ollama response.
+    
+    The server constrains decoding to valid JSON, so the response normally
+    parses as-is; _extract_json is only the fallback for servers or models
+    that still wrap it in prose.
+    
+    Args:
+        text: The 'response' field of the Ollama result
+        
+    Returns:
+        The decoded object
+    """
+    try:
+        value = _loads(text)
+    except ValueError:
+        return _extract_json(text)
+    if isinstance(value, dict):
+        return value
+    return _extract_json(text)
+
+
+# Web search runs on a small background pool so a slow DuckDuckGo response
+# can be abandoned after CONTEXT_SEARCH_TIMEOUT seconds; a search that finishes
+# late still lands in the cache for the next outline on the same topic
+CONTEXT_SEARCH_TIMEOUT = 3.0
+
+_BACKGROUND = ThreadPoolExecutor(max_workers=4, thread_name_prefix="slide-gen-bg")
+
+
+@lru_cache(maxsize=256)
+def _search_context(topic_key: str, max_results: int) -> str:
+    """
+    Run the DuckDuckGo search for a normalized topic and format the results.
+    
+    Raises on failure or no results so that only useful context is cached.
+    """
+    from duckduckgo_search import DDGS
+    
+    print(f"🌐 Searching web for current context on: {topic_key}")
+    ddgs = DDGS()
+    results = ddgs.text(topic_key, max_results=max_results)
+    
+    context_parts = []
+    for idx, result in enumerate(results, 1):
+        title = result.get('title', '')
+        body = result.get('body', '')
+        context_parts.append(f"{idx}. {title}\n{body}")
+    
+    if not context_parts:
+        raise LookupError("No web results found")
+    
+    context = "\n\n".join(context_parts)
+    print(f"✓ Found {len(context_parts)} current sources")
+    return f"\n\nCURRENT WEB CONTEXT:\n{context}\n"
+
 
 def get_current_context(topic: str, max_results: int = 5) -> str:
     """
     Fetch current web context about the topic using DuckDuckGo.
     
+    Results are cached per topic (case-insensitive), and the search is given
+    up after CONTEXT_SEARCH_TIMEOUT seconds.
+    
     Args:
         topic: The presentation topic
         max_results: Number of search results to fetch
@@ -27,30 +311,33 @@ def get_current_context(topic: str, max_results: int = 5) -> str:
     if not DDGS_AVAILABLE:
         return ""
     
+    future = _BACKGROUND.submit(_search_context, topic.strip().lower(), max_results)
     try:
-        print(f"🌐 Searching web for current context on: {topic}")
-        ddgs = DDGS()
-        results = ddgs.text(topic, max_results=max_results)
-        
-        context_parts = []
-        for idx, result in enumerate(results, 1):
-            title = result.get('title', '')
-            body = result.get('body', '')
-            context_parts.append(f"{idx}. {title}\n{body}")
-        
-        if context_parts:
-            context = "\n\n".join(context_parts)
-            print(f"✓ Found {len(context_parts)} current sources")
-            return f"\n\nCURRENT WEB CONTEXT:\n{context}\n"
-        else:
-            print("⚠️ No web results found")
-            return ""
-            
+        return future.result(timeout=CONTEXT_SEARCH_TIMEOUT)
+    except FutureTimeoutError:
+        print(f"⚠️ Web search timed out after {CONTEXT_SEARCH_TIMEOUT:.0f}s - continuing without it")
+        return ""
+    except LookupError:
+        print("⚠️ No web results found")
+        return ""
     except Exception as e:
         print(f"⚠️ DuckDuckGo search failed: {e}")
         return ""
 
 
+def _warm_up_model(model: str, ollama_url: str):
+    """Ask Ollama to load the model (a request with no prompt only loads it)."""
+    try:
+        _SESSION.post(
+            f"{ollama_url}/api/generate",
+            json={"model": model, "keep_alive": OLLAMA_KEEP_ALIVE, "options": {"num_ctx": OLLAMA_NUM_CTX}},
+            timeout=60
+        )
+    except requests.RequestException:
+        pass  # The real request will report connection problems
+
+
+@lru_cache(maxsize=None)
 def get_outline_system_prompt(lang: str = "en") -> str:
     """Get outline system prompt with language specification."""
     language_instruction = ""
@@ -65,8 +352,9 @@ Return ONLY valid JSON in this exact format:
   "title": "Presentation Title",
   "slides": [
     {{"title": "Slide Title", "type": "title"}},
-    {{"title": "Introduction", "type": "content"}},
-    {{"title": "Main Point 1", "type": "content"}},
+    {{"title": "Introduction", "type": "content", "points": ["First key point", "Second key point", "Third key point"], "speaker_notes": "2-3 conversational sentences for the presenter."}},
+    {{"title": "Main Point 1", "type": "content", "points": ["..."], "speaker_notes": "..."}},
+    {{"title": "Main Point 2", "type": "content"}},
     ...
   ]
 }}
@@ -76,9 +364,11 @@ Rules:
 - All other slides are type "content"
 - Use clear, professional slide titles
 - 8-12 slides total
+- Give the first 2 content slides 3-5 "points" and "speaker_notes"; the rest need only a title
 - No markdown, no extra text, ONLY JSON"""
 
 
+@lru_cache(maxsize=None)
 def get_content_system_prompt(lang: str = "en") -> str:
     """Get content system prompt with language specification."""
     language_instruction = ""
@@ -107,11 +397,91 @@ Rules:
 - ONLY return JSON"""
 
 
+@lru_cache(maxsize=None)
+def get_batch_content_system_prompt(lang: str = "en") -> str:
+    """Get system prompt for generating several slides' content in one call."""
+    language_instruction = ""
+    if lang == "hi":
+        language_instruction = "\n\nIMPORTANT: Generate ALL content in HINDI language. Bullet points and speaker notes must be in Hindi (Devanagari script)."
+    
+    return f"""You are a professional presentation content writer. Given presentation context and a numbered list of slide titles, generate detailed bullet points for every slide.
+{language_instruction}
+
+Return ONLY valid JSON in this exact format, with one entry per slide in the same order:
+{{
+  "slides": [
+    {{
+      "index": 1,
+      "points": [
+        "First key point with clear explanation",
+        "Second important point with details",
+        "Third critical concept",
+        ...
+      ],
+      "speaker_notes": "Detailed speaker notes explaining the slide content, providing context, examples, and talking points for the presenter. This should be 2-3 sentences."
+    }},
+    ...
+  ]
+}}
+
+Rules:
+- "index" is the slide's number from the list
+- 3-5 bullet points per slide
+- Each point should be clear and actionable
+- Speaker notes should be conversational and detailed
+- No markdown formatting
+- ONLY return JSON"""
+
+
 # Keep old constants for backwards compatibility
 OUTLINE_SYSTEM_PROMPT = get_outline_system_prompt("en")
 CONTENT_SYSTEM_PROMPT = get_content_system_prompt("en")
 
 
+def _outline_content(slide: Dict) -> Optional[Dict]:
+    """
+    Return the content the outline already wrote for a slide, if usable.
+    
+    The outline prompt asks for points and speaker notes on the first few
+    content slides so they need no separate generate_slide_content call.
+    
+    Args:
+        slide: Outline slide dict
+        
+    Returns:
+        Dict with 'points' and 'speaker_notes', or None if the slide needs generating
+    """
+    points = slide.get("points")
+    notes = slide.get("speaker_notes")
+    if (isinstance(points, list) and points and isinstance(notes, str) and notes
+            and all(isinstance(point, str) for point in points)):
+        return {"points": points, "speaker_notes": notes}
+    return None
+
+
+def _presentation_context(outline: Dict, web_context: str = "") -> str:
+    """
+    Shared prompt prefix for every content slide of a presentation.
+    
+    Every slide prompt starts with the same topic + outline + web context,
+    so Ollama prefills that prefix once and reuses its KV cache per slide.
+    
+    Args:
+        outline: Presentation outline with title and slides
+        web_context: Web context returned by get_current_context, if any
+        
+    Returns:
+        Context string for the slide content prompts
+    """
+    outline_block = "\n".join(f"- {slide['title']}" for slide in outline["slides"])
+    return f"{outline['title']}\n\nOutline:\n{outline_block}{web_context}"
+
+
+def _is_outline(outline: Dict) -> bool:
+    """Whether a parsed outline has the 'title' and 'slides' list callers index."""
+    return isinstance(outline.get("title"), str) and isinstance(outline.get("slides"), list)
+
+
 def generate_outline(
     topic: str,
     model: str = "llama3.1",
@@ -130,50 +500,50 @@ def generate_outline(
     Returns:
         Dict with 'title' and 'slides' list
     """
+    topic = _canonical_text(topic)
+    
+    # Load the model while the web search runs
+    _BACKGROUND.submit(_warm_up_model, model, ollama_url)
+    
     # Fetch current web context
     web_context = get_current_context(topic)
     
     prompt = f"Create a professional presentation outline for the topic: {topic}{web_context}"
+    payload = {
+        "model": model,
+        "prompt": prompt,
+        "system": get_outline_system_prompt(lang),
+        "stream": False,
+        "format": "json",
+        "keep_alive": OLLAMA_KEEP_ALIVE,
+        "options": {
+            "temperature": 0.3,
+            "top_p": 0.9,
+            "num_ctx": OLLAMA_NUM_CTX,
+            "num_predict": UNCAPPED_NUM_PREDICT
+        }
+    }
+    
+    cache_key = _llm_cache_key(payload)
+    cached = _get_cached_response(cache_key)
+    if cached is not None and _is_outline(cached):
+        return cached
     
     try:
-        response = requests.post(
-            f"{ollama_url}/api/generate",
-            json={
-                "model": model,
-                "prompt": prompt,
-                "system": get_outline_system_prompt(lang),
-                "stream": False,
-                "options": {
-                    "temperature": 0.3,
-                    "top_p": 0.9
-                }
-            },
-            timeout=60
-        )
-        response.raise_for_status()
-        
-        result = response.json()
+        result = _generate(payload, ollama_url)
         outline_text = result.get("response", "")
         
-        # Extract JSON from response (LLM might add extra text)
-        # Look for the first '{' and last '}' to extract just the JSON
-        start_idx = outline_text.find('{')
-        end_idx = outline_text.rfind('}')
-        
-        if start_idx == -1 or end_idx == -1:
-            raise ValueError(f"No JSON object found in response: {outline_text}")
-        
-        json_text = outline_text[start_idx:end_idx + 1]
-        
-        # Parse JSON from response
-        outline = json.loads(json_text.strip())
+        outline = _parse_llm_json(outline_text)
+        if not _is_outline(outline):
+            raise ValueError(f"Outline JSON is missing 'title' or 'slides'\nResponse: {outline_text}")
         
+        _cache_response(cache_key, outline)
         return outline
         
     except requests.RequestException as e:
         raise ConnectionError(f"Failed to connect to Ollama: {e}")
     except json.JSONDecodeError as e:
-        raise ValueError(f"Failed to parse outline JSON: {e}\nExtracted: {json_text if 'json_text' in locals() else outline_text}")
+        raise ValueError(f"Failed to parse outline JSON: {e}\nResponse: {outline_text}")
 
 
 def generate_slide_content(
@@ -197,72 +567,104 @@ def generate_slide_content(
         Dict with 'points' and 'speaker_notes'
     """
     prompt = f"""Presentation Topic: {presentation_context}
-Slide Title: {slide_title}
+Slide Title: {_canonical_text(slide_title)}
 
 Generate detailed content for this slide."""
+    payload = {
+        "model": model,
+        "prompt": prompt,
+        "system": get_content_system_prompt(lang),
+        "stream": False,
+        "format": "json",
+        "keep_alive": OLLAMA_KEEP_ALIVE,
+        "options": {
+            "temperature": 0.2,
+            "top_p": 0.9,
+            "num_ctx": OLLAMA_NUM_CTX,
+            "num_predict": _slide_num_predict(lang)
+        }
+    }
+    
+    cache_key = _llm_cache_key(payload)
+    cached = _get_cached_response(cache_key)
+    if cached is not None and _outline_content(cached) is not None:
+        return cached
     
     try:
-        response = requests.post(
-            f"{ollama_url}/api/generate",
-            json={
-                "model": model,
-                "prompt": prompt,
-                "system": get_content_system_prompt(lang),
-                "stream": False,
-                "options": {
-                    "temperature": 0.2,
-                    "top_p": 0.9
-                }
-            },
-            timeout=60
-        )
-        response.raise_for_status()
-        
-        result = response.json()
+        result = _generate(payload, ollama_url)
         content_text = result.get("response", "")
         
-        # Extract JSON from response (LLM might add extra text)
-        start_idx = content_text.find('{')
-        end_idx = content_text.rfind('}')
-        
-        if start_idx == -1 or end_idx == -1:
-            raise ValueError(f"No JSON object found in response: {content_text}")
-        
-        json_text = content_text[start_idx:end_idx + 1]
-        
-        # Parse JSON from response
-        content = json.loads(json_text.strip())
+        content = _outline_content(_parse_llm_json(content_text))
+        if content is None:
+            raise ValueError(f"Content JSON is missing 'points' or 'speaker_notes'\nResponse: {content_text}")
         
+        _cache_response(cache_key, content)
         return content
         
     except requests.RequestException as e:
         raise ConnectionError(f"Failed to connect to Ollama: {e}")
     except json.JSONDecodeError as e:
-        raise ValueError(f"Failed to parse content JSON: {e}\nExtracted: {json_text if 'json_text' in locals() else content_text}")
+        raise ValueError(f"Failed to parse content JSON: {e}\nResponse: {content_text}")
 
 
 def generate_full_script(
     outline: Dict,
     model: str = "llama3.1",
-    ollama_url: str = "http://localhost:11434"
+    ollama_url: str = "http://localhost:11434",
+    max_workers: int = 4,
+    web_context: str = ""
 ) -> Dict:
     """
     Generate content for all slides in the outline.
     
+    Content slides are requested from Ollama concurrently (up to max_workers
+    at a time). The server only overlaps them when OLLAMA_NUM_PARALLEL is at
+    least max_workers; otherwise it queues them and this behaves like the
+    sequential loop.
+    
     Args:
         outline: Presentation outline with title and slides
         model: Ollama model name
         ollama_url: Ollama API URL
+        max_workers: Maximum number of slide requests in flight at once
+        web_context: Web context returned by get_current_context, if any
         
     Returns:
         Complete presentation dict with all slide content
     """
+    # Load the model (if it was unloaded since the outline) while the
+    # prompts are assembled
+    _BACKGROUND.submit(_warm_up_model, model, ollama_url)
+    
     presentation = {
         "title": outline["title"],
         "slides": []
     }
     
-    context = outline["title"]
+    context = _presentation_context(outline, web_context)
+    
+    # Slides the outline already filled in are used as-is
+    contents = {}
+    for slide in outline["slides"]:
+        if slide["type"] != "title":
+            content = _outline_content(slide)
+            if content is not None:
+                contents.setdefault(slide["title"], content)
+    
+    # The context is shared, so repeated titles would produce identical
+    # prompts: request each distinct title once
+    content_titles = list(dict.fromkeys(
+        slide["title"] for slide in outline["slides"]
+        if slide["type"] != "title" and slide["title"] not in contents
+    ))
+    
+    # Fire all remaining content-slide requests at once
+    if content_titles:
+        with ThreadPoolExecutor(max_workers=min(len(content_titles), max_workers)) as executor:
+            contents.update(zip(content_titles, executor.map(
+                lambda title: generate_slide_content(title, context, model, ollama_url),
+                content_titles
+            )))
     
     for slide in outline["slides"]:
         if slide["type"] == "title":
@@ -274,8 +676,7 @@ def generate_full_script(
                 "speaker_notes": f"Welcome to the presentation on {outline['title']}"
             })
         else:
-            # Generate content for content slides
-            content = generate_slide_content(slide["title"], context, model, ollama_url)
+            content = contents[slide["title"]]
             presentation["slides"].append({
                 "title": slide["title"],
                 "type": "content",
@@ -288,11 +689,9 @@ def generate_full_script(
 
 def save_outline(outline: Dict, output_path: Path):
     """Save outline to JSON file."""
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(outline, indent=2, ensure_ascii=False), encoding='utf-8')
+    _write_json(outline, output_path)
 
 
 def save_script(script: Dict, output_path: Path):
     """Save full script to JSON file."""
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(script, indent=2, ensure_ascii=False), encoding='utf-8')
+    _write_json(script, output_path)
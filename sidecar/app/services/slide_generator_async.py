@@ -2,10 +2,52 @@
 
 import asyncio
 import json
-from typing import Dict, List
+import random
+from typing import Dict, List, Optional
 from pathlib import Path
 import aiohttp
-from .slide_generator import get_current_context, get_outline_system_prompt, get_content_system_prompt
+from ..config import config
+from .slide_generator import (
+    get_current_context, get_outline_system_prompt, get_content_system_prompt, get_batch_content_system_prompt,
+    OLLAMA_KEEP_ALIVE, OLLAMA_NUM_CTX, UNCAPPED_NUM_PREDICT, ORJSON_AVAILABLE,
+    _BACKGROUND, _cache_response, _canonical_text, _get_cached_response, _is_truncated, _llm_cache_key, _loads, _outline_content,
+    _parse_llm_json, _presentation_context, _slide_num_predict, _uncapped, _warm_up_model, _write_json
+)
+
+
+if ORJSON_AVAILABLE:
+    import orjson
+    
+    def _dumps(obj) -> str:
+        """Serialize request bodies with orjson (aiohttp's json= hook expects str)."""
+        return orjson.dumps(obj).decode('utf-8')
+else:
+    _dumps = json.dumps
+
+# Tries per single-slide request, and the HTTP statuses worth retrying
+SLIDE_REQUEST_ATTEMPTS = 3
+_RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+# Slides generated per batched request. Larger batches share more prefill
+# but make one long decode that must finish within the session timeout.
+SLIDE_BATCH_SIZE = 5
+
+
+def _cached_slide_content(cache_key: str) -> Optional[Dict]:
+    """Cached slide content, or None if absent or missing points/speaker notes."""
+    cached = _get_cached_response(cache_key)
+    return _outline_content(cached) if cached is not None else None
+
+
+def _placeholder_content(slide_title: str) -> Dict:
+    """Content shown for a slide whose generation failed."""
+    return {
+        "points": [
+            "Content generation in progress",
+            "Please check back later"
+        ],
+        "speaker_notes": f"This slide covers {slide_title}."
+    }
 
 
 class AsyncSlideGenerator:
@@ -15,11 +57,19 @@ class AsyncSlideGenerator:
         self.model = model
         self.ollama_url = ollama_url
         self._session = None
+        # Bounds concurrent slide requests so a long deck doesn't flood Ollama
+        self._inflight = asyncio.Semaphore(config.OLLAMA_MAX_INFLIGHT)
     
     async def __aenter__(self):
         """Create shared aiohttp session."""
         timeout = aiohttp.ClientTimeout(total=120)
-        self._session = aiohttp.ClientSession(timeout=timeout)
+        # One keep-alive connection per in-flight request (plus one for the
+        # outline/priming call), reused across the whole deck
+        connector = aiohttp.TCPConnector(
+            limit_per_host=config.OLLAMA_MAX_INFLIGHT + 1,
+            keepalive_timeout=60
+        )
+        self._session = aiohttp.ClientSession(timeout=timeout, connector=connector, json_serialize=_dumps)
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -27,106 +77,311 @@ class AsyncSlideGenerator:
         if self._session:
             await self._session.close()
     
-    async def generate_outline(self, topic: str, lang: str = "en") -> Dict:
-        """Generate presentation outline asynchronously."""
-        web_context = get_current_context(topic)
+    async def fetch_web_context(self, topic: str) -> str:
+        """
+        Search the web for current context on a topic (see get_current_context).
+        
+        The model is loaded in the background while the search runs; the
+        search blocks for up to CONTEXT_SEARCH_TIMEOUT, so it runs off the
+        event loop.
+        """
+        _BACKGROUND.submit(_warm_up_model, self.model, self.ollama_url)
+        return await asyncio.to_thread(get_current_context, _canonical_text(topic))
+    
+    async def generate_outline(self, topic: str, lang: str = "en", web_context: Optional[str] = None) -> Dict:
+        """
+        Generate presentation outline asynchronously.
+        
+        Args:
+            topic: The presentation topic
+            lang: Language code ('en' or 'hi')
+            web_context: Result of fetch_web_context for this topic; fetched
+                here when None. Pass the same value to the slide generation
+                so its prompts share the context.
+        """
+        topic = _canonical_text(topic)
+        if web_context is None:
+            web_context = await self.fetch_web_context(topic)
         prompt = f"Create a professional presentation outline for the topic: {topic}{web_context}"
         
         try:
-            async with self._session.post(
-                f"{self.ollama_url}/api/generate",
-                json={
-                    "model": self.model,
-                    "prompt": prompt,
-                    "system": get_outline_system_prompt(lang),
-                    "stream": False,
-                    "options": {
-                        "temperature": 0.3,
-                        "top_p": 0.9
-                    }
+            result = await self._post_generate({
+                "model": self.model,
+                "prompt": prompt,
+                "system": get_outline_system_prompt(lang),
+                "stream": False,
+                "format": "json",
+                "keep_alive": OLLAMA_KEEP_ALIVE,
+                "options": {
+                    "temperature": 0.3,
+                    "top_p": 0.9,
+                    "num_ctx": OLLAMA_NUM_CTX,
+                    "num_predict": UNCAPPED_NUM_PREDICT
                 }
-            ) as response:
-                response.raise_for_status()
-                result = await response.json()
-                outline_text = result.get("response", "")
-                
-                # Extract JSON
-                start_idx = outline_text.find('{')
-                end_idx = outline_text.rfind('}')
-                
-                if start_idx == -1 or end_idx == -1:
-                    raise ValueError(f"No JSON object found in response")
-                
-                json_text = outline_text[start_idx:end_idx + 1]
-                outline = json.loads(json_text.strip())
-                
-                return outline
+            })
+            outline_text = result.get("response", "")
+            
+            return _parse_llm_json(outline_text)
         
         except aiohttp.ClientError as e:
             raise ConnectionError(f"Failed to connect to Ollama: {e}")
     
+    def _slide_content_payload(self, slide_title: str, context: str, lang: str) -> Dict:
+        """Build the /api/generate payload for one slide (also its cache key source)."""
+        prompt = f"""Presentation Context: {context}
+
+Slide Title: {_canonical_text(slide_title)}
+
+Create comprehensive content for this slide."""
+        return {
+            "model": self.model,
+            "prompt": prompt,
+            "system": get_content_system_prompt(lang),
+            "stream": False,
+            "format": "json",
+            "keep_alive": OLLAMA_KEEP_ALIVE,
+            "options": {
+                "temperature": 0.5,
+                "top_p": 0.9,
+                "num_ctx": OLLAMA_NUM_CTX,
+                "num_predict": _slide_num_predict(lang)
+            }
+        }
+    
+    async def _post_generate(self, payload: Dict) -> Dict:
+        """POST /api/generate and decode the result (raises aiohttp.ClientResponseError on HTTP errors)."""
+        async with self._session.post(
+            f"{self.ollama_url}/api/generate",
+            json=payload
+        ) as response:
+            response.raise_for_status()
+            return _loads(await response.read())
+    
+    async def _complete_truncated(self, payload: Dict, result: Dict) -> Dict:
+        """
+        Re-request a response that stopped at its num_predict cap, uncapped.
+        
+        Cut-off output is unparseable JSON; one uncapped retry is cheaper than
+        falling back to per-slide requests or placeholders.
+        """
+        if not _is_truncated(payload, result):
+            return result
+        print("⚠️ Response hit the num_predict cap, retrying without it")
+        async with self._inflight:
+            return await self._post_generate(_uncapped(payload))
+    
     async def generate_slide_content(
         self,
         slide_title: str,
         context: str,
         lang: str = "en"
     ) -> Dict:
-        """Generate content for a single slide asynchronously."""
-        prompt = f"""Presentation Context: {context}
-
-Slide Title: {slide_title}
-
-Create comprehensive content for this slide."""
+        """
+        Generate content for a single slide asynchronously.
+        
+        Transient failures (connection errors, timeouts, 429/5xx) are retried
+        up to SLIDE_REQUEST_ATTEMPTS times with jittered backoff, honouring
+        Retry-After on 429; only then is placeholder content returned.
+        """
+        payload = self._slide_content_payload(slide_title, context, lang)
+        cache_key = _llm_cache_key(payload)
+        cached = _cached_slide_content(cache_key)
+        if cached is not None:
+            return cached
+        
+        for attempt in range(1, SLIDE_REQUEST_ATTEMPTS + 1):
+            delay = min(2 ** (attempt - 1), 4) + random.random() * 0.2
+            try:
+                result = None
+                async with self._inflight, self._session.post(
+                    f"{self.ollama_url}/api/generate",
+                    json=payload
+                ) as response:
+                    if response.status not in _RETRY_STATUSES or attempt == SLIDE_REQUEST_ATTEMPTS:
+                        response.raise_for_status()
+                        result = _loads(await response.read())
+                    else:
+                        retry_after = response.headers.get("Retry-After", "")
+                        if response.status == 429 and retry_after.isdigit():
+                            delay = int(retry_after)
+                        print(f"⚠️ Ollama returned {response.status} for '{slide_title}', retrying ({attempt}/{SLIDE_REQUEST_ATTEMPTS})")
+                
+                if result is not None:
+                    # Outside the slot above: the uncapped retry takes its own
+                    result = await self._complete_truncated(payload, result)
+                    content_text = result.get("response", "")
+                    
+                    # Only usable content is cached; anything else would be
+                    # replayed for the whole cache TTL
+                    content = _outline_content(_parse_llm_json(content_text))
+                    if content is None:
+                        raise ValueError(f"Content JSON is missing 'points' or 'speaker_notes': {content_text}")
+                    _cache_response(cache_key, content)
+                    return content
+            
+            except aiohttp.ClientResponseError as e:
+                error = e  # non-transient status (or the last attempt's)
+                break
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt == SLIDE_REQUEST_ATTEMPTS:
+                    error = e
+                    break
+                print(f"⚠️ Request for '{slide_title}' failed, retrying ({attempt}/{SLIDE_REQUEST_ATTEMPTS}): {e}")
+            except ValueError as e:  # unparseable response (JSONDecodeError included)
+                error = e
+                break
+            
+            # Back off outside the semaphore so other slides can use the slot
+            await asyncio.sleep(delay)
+        
+        print(f"⚠️ Content generation failed for '{slide_title}': {error}")
+        return _placeholder_content(slide_title)
+    
+    async def _prime_context(self, context: str, lang: str = "en"):
+        """
+        Prefill the batch system prompt and presentation context on the server.
         
+        Generates a single token so Ollama caches the shared prompt prefix;
+        the batched requests that follow start with the same bytes and only
+        prefill their slide titles.
+        """
         try:
             async with self._session.post(
                 f"{self.ollama_url}/api/generate",
                 json={
                     "model": self.model,
-                    "prompt": prompt,
-                    "system": get_content_system_prompt(lang),
+                    "prompt": f"Presentation Context: {context}\n\n",
+                    "system": get_batch_content_system_prompt(lang),
                     "stream": False,
+                    "keep_alive": OLLAMA_KEEP_ALIVE,
                     "options": {
-                        "temperature": 0.5,
-                        "top_p": 0.9
+                        "num_ctx": OLLAMA_NUM_CTX,
+                        "num_predict": 1
                     }
                 }
             ) as response:
-                response.raise_for_status()
-                result = await response.json()
-                content_text = result.get("response", "")
-                
-                # Extract JSON
-                start_idx = content_text.find('{')
-                end_idx = content_text.rfind('}')
-                
-                if start_idx == -1 or end_idx == -1:
-                    raise ValueError(f"No JSON object found in response")
-                
-                json_text = content_text[start_idx:end_idx + 1]
-                content = json.loads(json_text.strip())
-                
-                return content
-        
-        except (aiohttp.ClientError, json.JSONDecodeError) as e:
-            print(f"⚠️ Content generation failed for '{slide_title}': {e}")
-            return {
-                "points": [
-                    "Content generation in progress",
-                    "Please check back later"
-                ],
-                "speaker_notes": f"This slide covers {slide_title}."
+                await response.read()
+        except aiohttp.ClientError:
+            pass  # The real requests will report connection problems
+    
+    async def generate_slide_contents_batch(
+        self,
+        slide_titles: List[str],
+        context: str,
+        lang: str = "en"
+    ) -> List[Dict]:
+        """
+        Generate content for several slides with a single Ollama request.
+        
+        The system prompt and context are prefilled once for the whole batch
+        instead of once per slide. Slides already in the LLM response cache
+        are not requested, and each generated slide is cached under the same
+        key generate_slide_content uses. Slides the model leaves out or
+        returns malformed are generated individually.
+        
+        Args:
+            slide_titles: Slide titles, in order
+            context: Presentation context shared by all slides
+            lang: Language code ('en' or 'hi')
+            
+        Returns:
+            List of dicts with 'points' and 'speaker_notes', one per title
+        """
+        cache_keys = [
+            _llm_cache_key(self._slide_content_payload(title, context, lang))
+            for title in slide_titles
+        ]
+        contents = [_cached_slide_content(key) for key in cache_keys]
+        pending = [idx for idx, content in enumerate(contents) if content is None]
+        
+        if len(pending) > 1:
+            await self._generate_batch_into(contents, cache_keys, pending, slide_titles, context, lang)
+        
+        missing = [idx for idx, content in enumerate(contents) if content is None]
+        if missing:
+            # One slide failing must not discard the slides the batch produced
+            retried = await asyncio.gather(
+                *(self.generate_slide_content(slide_titles[idx], context, lang=lang) for idx in missing),
+                return_exceptions=True
+            )
+            for idx, content in zip(missing, retried):
+                if isinstance(content, Exception):
+                    print(f"⚠️ Content generation failed for '{slide_titles[idx]}': {content}")
+                    content = _placeholder_content(slide_titles[idx])
+                contents[idx] = content
+        
+        return contents
+    
+    async def _generate_batch_into(
+        self,
+        contents: List[Optional[Dict]],
+        cache_keys: List[str],
+        pending: List[int],
+        slide_titles: List[str],
+        context: str,
+        lang: str
+    ):
+        """Request the pending slides in one call and fill contents/cache in place."""
+        numbered = "\n".join(
+            f"### SLIDE {number}: {_canonical_text(slide_titles[idx])}" for number, idx in enumerate(pending, 1)
+        )
+        prompt = f"""Presentation Context: {context}
+
+{numbered}
+
+Create comprehensive content for each of these {len(pending)} slides."""
+        
+        payload = {
+            "model": self.model,
+            "prompt": prompt,
+            "system": get_batch_content_system_prompt(lang),
+            "stream": False,
+            "format": "json",
+            "keep_alive": OLLAMA_KEEP_ALIVE,
+            "options": {
+                "temperature": 0.5,
+                "top_p": 0.9,
+                "num_ctx": OLLAMA_NUM_CTX,
+                "num_predict": _slide_num_predict(lang, len(pending))
             }
+        }
+        
+        try:
+            async with self._inflight:
+                result = await self._post_generate(payload)
+            result = await self._complete_truncated(payload, result)
+            entries = _parse_llm_json(result.get("response", "")).get("slides")
+            
+            if isinstance(entries, list):
+                for position, entry in enumerate(entries):
+                    if not isinstance(entry, dict):
+                        continue
+                    number = entry.get("index", position + 1)
+                    if not (isinstance(number, int) and 1 <= number <= len(pending)):
+                        continue
+                    idx = pending[number - 1]
+                    content = _outline_content(entry)
+                    if contents[idx] is None and content is not None:
+                        contents[idx] = content
+                        _cache_response(cache_keys[idx], content)
+        
+        except (aiohttp.ClientError, ValueError) as e:
+            print(f"⚠️ Batched content generation failed, generating slides one by one: {e}")
     
-    async def generate_full_script(self, outline: Dict) -> Dict:
-        """Generate content for all slides in parallel."""
+    async def generate_full_script(self, outline: Dict, web_context: str = "") -> Dict:
+        """
+        Generate content for all slides in parallel.
+        
+        Args:
+            outline: Presentation outline dict
+            web_context: Web context the outline was generated with, if any
+        """
         presentation = {
             "title": outline["title"],
             "slides": []
         }
         
-        context = outline["title"]
-        tasks = []
+        context = _presentation_context(outline, web_context)
         slide_metadata = []
         
         # Create tasks for parallel generation
@@ -140,20 +395,54 @@ Create comprehensive content for this slide."""
                     "speaker_notes": f"Welcome to the presentation on {outline['title']}"
                 })
             else:
-                # Queue content generation task
-                task = self.generate_slide_content(slide["title"], context)
-                tasks.append(task)
                 slide_metadata.append({
                     "title": slide["title"],
                     "type": "content"
                 })
         
-        # Execute all content generation in parallel
-        print(f"🚀 Generating content for {len(tasks)} slides in parallel...")
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Slides the outline already filled in need no LLM call
+        results_by_title = {}
+        for slide in outline["slides"]:
+            if slide["type"] != "title":
+                content = _outline_content(slide)
+                if content is not None:
+                    results_by_title.setdefault(slide["title"], content)
+        
+        # Repeated titles share one prompt (same context), so generate each once
+        unique_titles = list(dict.fromkeys(
+            metadata["title"] for metadata in slide_metadata
+            if metadata["title"] not in results_by_title
+        ))
+        
+        # Slides answered from the LLM response cache need no request either
+        for title in unique_titles:
+            cached = _cached_slide_content(_llm_cache_key(self._slide_content_payload(title, context, "en")))
+            if cached is not None:
+                results_by_title[title] = cached
+        unique_titles = [title for title in unique_titles if title not in results_by_title]
+        
+        # Generate in batches of SLIDE_BATCH_SIZE slides per request, batches in parallel
+        batches = [
+            unique_titles[i:i + SLIDE_BATCH_SIZE]
+            for i in range(0, len(unique_titles), SLIDE_BATCH_SIZE)
+        ]
+        print(f"🚀 Generating content for {len(unique_titles)} slides in {len(batches)} batched requests...")
+        if len(batches) > 1:
+            # Parallel requests would each prefill the shared prefix; do it once
+            await self._prime_context(context)
+        batch_results = await asyncio.gather(
+            *(self.generate_slide_contents_batch(batch, context) for batch in batches),
+            return_exceptions=True
+        )
+        for batch, result in zip(batches, batch_results):
+            if isinstance(result, Exception):
+                results_by_title.update(dict.fromkeys(batch, result))
+            else:
+                results_by_title.update(zip(batch, result))
         
         # Process results
-        for metadata, result in zip(slide_metadata, results):
+        for metadata in slide_metadata:
+            result = results_by_title[metadata["title"]]
             if isinstance(result, Exception):
                 print(f"⚠️ Failed to generate content for '{metadata['title']}': {result}")
                 content = {
@@ -172,84 +461,159 @@ Create comprehensive content for this slide."""
         
         return presentation
     
-    async def generate_slides_streaming(self, outline: Dict, lang: str = "en"):
+    async def generate_slides_streaming(self, outline: Dict, lang: str = "en", web_context: str = ""):
         """
         Generate slides one by one (streaming) for immediate downstream processing.
         
         Yields each slide as soon as it's generated, allowing parallel TTS/image tasks
-        to start immediately instead of waiting for all slides.
+        to start immediately instead of waiting for all slides. Later slides are
+        generated in the background (up to OLLAMA_MAX_INFLIGHT at a time) while
+        earlier ones are being consumed; slides are still yielded in order.
         
         Args:
             outline: Presentation outline dict
             lang: Language code ('en' or 'hi')
+            web_context: Web context the outline was generated with, if any
         
         Yields:
             Dict: Slide data with title, type, points, speaker_notes, slide_index
         """
-        context = outline["title"]
-        slide_index = 0
+        context = _presentation_context(outline, web_context)
         
-        # Process each slide in order
-        for slide in outline["slides"]:
-            if slide["type"] == "title":
-                # Yield title slide immediately (no LLM call)
-                yield {
-                    "title": slide["title"],
-                    "type": "title",
-                    "points": [],
-                    "speaker_notes": f"Welcome to the presentation on {outline['title']}",
-                    "slide_index": slide_index
-                }
-                slide_index += 1
-            else:
-                # Generate content for this slide
+        # Start every slide the outline didn't fill in; the semaphore in
+        # generate_slide_content keeps at most OLLAMA_MAX_INFLIGHT running
+        pending = {
+            slide_index: asyncio.create_task(self.generate_slide_content(slide["title"], context, lang=lang))
+            for slide_index, slide in enumerate(outline["slides"])
+            if slide["type"] != "title" and _outline_content(slide) is None
+        }
+        
+        try:
+            # Yield each slide in order
+            for slide_index, slide in enumerate(outline["slides"]):
+                if slide["type"] == "title":
+                    # Yield title slide immediately (no LLM call)
+                    yield {
+                        "title": slide["title"],
+                        "type": "title",
+                        "points": [],
+                        "speaker_notes": f"Welcome to the presentation on {outline['title']}",
+                        "slide_index": slide_index
+                    }
+                    continue
+                
+                # Wait for this slide's content (unless the outline already has it)
                 try:
-                    print(f"[⚡ Streaming] Generating slide {slide_index + 1}: {slide['title']}")
-                    content = await self.generate_slide_content(slide["title"], context, lang=lang)
+                    content = _outline_content(slide)
+                    if content is None:
+                        print(f"[⚡ Streaming] Generating slide {slide_index + 1}: {slide['title']}")
+                        content = await pending.pop(slide_index)
                     
-                    yield {
+                    slide_data = {
                         "title": slide["title"],
                         "type": "content",
                         "points": content["points"],
                         "speaker_notes": content["speaker_notes"],
                         "slide_index": slide_index
                     }
-                    slide_index += 1
                     
                 except Exception as e:
                     print(f"⚠️ Failed to generate slide '{slide['title']}': {e}")
                     # Yield placeholder slide
-                    yield {
+                    slide_data = {
                         "title": slide["title"],
                         "type": "content",
                         "points": ["Content generation failed"],
                         "speaker_notes": f"This slide covers {slide['title']}.",
                         "slide_index": slide_index
                     }
-                    slide_index += 1
+                
+                yield slide_data
+        
+        finally:
+            # Consumer stopped early: don't leave requests running
+            for task in pending.values():
+                task.cancel()
+
+
+# Generators shared by the standalone helpers, one per (model, url) and event
+# loop (an aiohttp session only works on the loop that created it), so the
+# outline, script and streaming calls of a deck reuse one connection pool
+_GENERATORS: Dict[tuple, AsyncSlideGenerator] = {}
+
+
+async def get_generator(model: str = "llama3.1", ollama_url: str = "http://localhost:11434") -> AsyncSlideGenerator:
+    """
+    Get the shared generator for this model and URL, creating it on first use.
+    
+    Args:
+        model: Ollama model name
+        ollama_url: Ollama API URL
+        
+    Returns:
+        An open AsyncSlideGenerator (closed by close_generators)
+    """
+    loop = asyncio.get_running_loop()
+    
+    # Sessions of loops that have since closed can't be used (or closed) any more
+    for key in [key for key in _GENERATORS if key[2].is_closed()]:
+        del _GENERATORS[key]
+    
+    key = (model, ollama_url, loop)
+    generator = _GENERATORS.get(key)
+    if generator is None or generator._session.closed:
+        generator = await AsyncSlideGenerator(model, ollama_url).__aenter__()
+        _GENERATORS[key] = generator
+    return generator
+
+
+async def close_generators():
+    """Close the shared generators' sessions on the running loop (app shutdown)."""
+    loop = asyncio.get_running_loop()
+    for key in [key for key in _GENERATORS if key[2] is loop]:
+        await _GENERATORS.pop(key).__aexit__(None, None, None)
+
+
+async def fetch_web_context_async(topic: str, model: str = "llama3.1", ollama_url: str = "http://localhost:11434") -> str:
+    """
+    Standalone web-context search for a topic (also warms up the model).
+    
+    Generators are shared across requests, so callers hold on to the result
+    and pass it to both the outline and the slide generation of one deck.
+    """
+    generator = await get_generator(model, ollama_url)
+    return await generator.fetch_web_context(topic)
 
 
-async def generate_outline_async(topic: str, lang: str = "en", model: str = "llama3.1", ollama_url: str = "http://localhost:11434") -> Dict:
+async def generate_outline_async(
+    topic: str,
+    lang: str = "en",
+    model: str = "llama3.1",
+    ollama_url: str = "http://localhost:11434",
+    web_context: Optional[str] = None
+) -> Dict:
     """Standalone async outline generation."""
-    async with AsyncSlideGenerator(model, ollama_url) as generator:
-        return await generator.generate_outline(topic, lang=lang)
+    generator = await get_generator(model, ollama_url)
+    return await generator.generate_outline(topic, lang=lang, web_context=web_context)
 
 
 async def generate_full_script_async(
     outline: Dict,
     model: str = "llama3.1",
-    ollama_url: str = "http://localhost:11434"
+    ollama_url: str = "http://localhost:11434",
+    web_context: str = ""
 ) -> Dict:
     """Standalone async script generation."""
-    async with AsyncSlideGenerator(model, ollama_url) as generator:
-        return await generator.generate_full_script(outline)
+    generator = await get_generator(model, ollama_url)
+    return await generator.generate_full_script(outline, web_context=web_context)
 
 
 async def generate_slides_streaming_async(
     outline: Dict,
     lang: str = "en",
     model: str = "llama3.1",
-    ollama_url: str = "http://localhost:11434"
+    ollama_url: str = "http://localhost:11434",
+    web_context: str = ""
 ):
     """
     Standalone async streaming slide generation.
@@ -257,18 +621,26 @@ async def generate_slides_streaming_async(
     Yields slides one by one for immediate downstream processing (TTS, images).
     This enables overlapping operations instead of sequential execution.
     """
-    async with AsyncSlideGenerator(model, ollama_url) as generator:
-        async for slide in generator.generate_slides_streaming(outline, lang=lang):
-            yield slide
+    generator = await get_generator(model, ollama_url)
+    async for slide in generator.generate_slides_streaming(outline, lang=lang, web_context=web_context):
+        yield slide
 
 
 def save_outline(outline: Dict, output_path: Path):
     """Save outline to JSON file."""
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(outline, indent=2, ensure_ascii=False), encoding='utf-8')
+    _write_json(outline, output_path)
 
 
 def save_script(script: Dict, output_path: Path):
     """Save full script to JSON file."""
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(json.dumps(script, indent=2, ensure_ascii=False), encoding='utf-8')
+    _write_json(script, output_path)
+
+
+async def save_outline_async(outline: Dict, output_path: Path):
+    """Save outline to JSON file without blocking the event loop."""
+    await asyncio.to_thread(_write_json, outline, output_path)
+
+
+async def save_script_async(script: Dict, output_path: Path):
+    """Save full script to JSON file without blocking the event loop."""
+    await asyncio.to_thread(_write_json, script, output_path)
@@ -43,6 +43,10 @@ License: MIT
 from dataclasses import dataclass, field
 from typing import List, Optional, Tuple, Dict, Any
 from enum import Enum
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+from operator import attrgetter
 import math
 import re
 
@@ -63,7 +67,38 @@ class FontScalingStrategy(Enum):
     AGGRESSIVE = "aggressive"  # 15% reduction
 
 
-@dataclass
+class _CharWidthTable(dict):
+    """Character → width map for one font size; unseen characters are classified on first lookup."""
+    __slots__ = ("metrics", "font_size")
+    
+    def __missing__(self, char: str) -> float:
+        metrics, font_size = self.metrics, self.font_size
+        if char in metrics.narrow_chars:
+            width = font_size * 0.4
+        elif char in metrics.wide_chars:
+            width = font_size * 0.9
+        elif char in metrics.extra_wide_chars:
+            width = font_size * 1.2
+        elif char.isupper():
+            width = font_size * metrics.avg_char_width * metrics.capital_ratio
+        elif char == ' ':
+            width = font_size * metrics.word_spacing
+        else:
+            width = font_size * metrics.avg_char_width
+        self[char] = width
+        return width
+
+
+@lru_cache(maxsize=32)
+def _char_width_table(metrics: "TypographyMetrics", font_size: float) -> _CharWidthTable:
+    """Shared width table per (metrics, font size); a deck only uses a few sizes."""
+    table = _CharWidthTable()
+    table.metrics = metrics
+    table.font_size = font_size
+    return table
+
+
+@dataclass(slots=True, frozen=True)
 class TypographyMetrics:
     """Advanced typography metrics for precise text measurement."""
     avg_char_width: float = 0.6  # Average character width ratio (relative to font size)
@@ -83,25 +118,15 @@ class TypographyMetrics:
         
         Algorithm:
             width = Σ(char_width(c) × font_size) for c in text
+        
+        Per-character widths come from a table filled once per character and
+        font size, so the sum runs in C via map() instead of a chain of
+        membership tests per character.
         """
-        width = 0
-        for char in text:
-            if char in self.narrow_chars:
-                width += font_size * 0.4
-            elif char in self.wide_chars:
-                width += font_size * 0.9
-            elif char in self.extra_wide_chars:
-                width += font_size * 1.2
-            elif char.isupper():
-                width += font_size * self.avg_char_width * self.capital_ratio
-            elif char == ' ':
-                width += font_size * self.word_spacing
-            else:
-                width += font_size * self.avg_char_width
-        return width
+        return sum(map(_char_width_table(self, font_size).__getitem__, text))
 
 
-@dataclass
+@dataclass(slots=True)
 class LayoutConfig:
     """
     Advanced configuration for slide layout calculations.
@@ -145,9 +170,12 @@ class LayoutConfig:
     
     # === OPTIMIZATION ===
     optimize_spacing: bool = True      # Optimize paragraph spacing
-    balance_slides: bool = True        # Balance content across multiple slides
+    balance_slides: bool = True        # Balanced (DP) slide breaks instead of greedy fill
     min_paragraphs_per_slide: int = 1  # Minimum paragraphs per slide
     
+    # === DIAGNOSTICS ===
+    debug: bool = False                # Record the step-by-step debug log
+    
     @property
     def textbox_height(self) -> float:
         """Calculate available textbox height."""
@@ -174,7 +202,7 @@ class LayoutConfig:
         return strategy_map.get(self.font_scaling_strategy, 0.90)
 
 
-@dataclass
+@dataclass(slots=True)
 class ParagraphMetrics:
     """
     Detailed metrics for a single paragraph.
@@ -197,7 +225,13 @@ class ParagraphMetrics:
         self.char_count = len(self.text)
 
 
-@dataclass
+# Column getters for ParagraphMetrics (map() over these runs without a Python frame per item)
+_HEIGHT_REQUIRED = attrgetter("height_required")
+_FONT_SIZE = attrgetter("font_size")
+_ESTIMATED_LINES = attrgetter("estimated_lines")
+
+
+@dataclass(slots=True)
 class SlideLayout:
     """
     Complete layout information for a single slide.
@@ -217,6 +251,17 @@ class SlideLayout:
     overflow_amount: float = 0.0       # Amount of overflow (if any)
     optimization_applied: str = "none"  # Optimization techniques applied
     
+    # Per-paragraph columns (struct-of-arrays view of paragraph_metrics)
+    heights: Tuple[float, ...] = field(init=False)
+    font_sizes: Tuple[float, ...] = field(init=False)
+    line_counts: Tuple[int, ...] = field(init=False)
+    
+    def __post_init__(self):
+        """Build the column views once so consumers don't walk the metric objects."""
+        self.heights = tuple(map(_HEIGHT_REQUIRED, self.paragraph_metrics))
+        self.font_sizes = tuple(map(_FONT_SIZE, self.paragraph_metrics))
+        self.line_counts = tuple(map(_ESTIMATED_LINES, self.paragraph_metrics))
+    
     @property
     def utilization_ratio(self) -> float:
         """Calculate space utilization ratio (0.0 - 1.0+)."""
@@ -235,6 +280,170 @@ class SlideLayout:
         return self.total_height_used > self.available_height
 
 
+@lru_cache(maxsize=4096)
+def _measure_paragraph(
+    text: str,
+    font_size: float,
+    typography: Optional[TypographyMetrics],
+    textbox_width: float,
+    chars_per_line: int,
+    line_spacing: float
+) -> ParagraphMetrics:
+    """
+    Measure one paragraph (see SlideLayoutEngine._calculate_paragraph_metrics).
+    
+    Pure in its arguments, so results are shared across engines; callers
+    must not mutate the returned ParagraphMetrics.
+    
+    Args:
+        text: Raw paragraph text (leading spaces mark a sub-point)
+        font_size: Font size in points
+        typography: Metrics for width estimation, or None for the
+            characters-per-line estimate
+        textbox_width: Available textbox width (points)
+        chars_per_line: Characters per line for the simple estimate
+        line_spacing: Line height multiplier
+    """
+    # Detect indentation level
+    is_subpoint = text.startswith('  ')
+    indent_level = len(text) - len(text.lstrip())
+    clean_text = text.strip()
+    
+    # === ESTIMATE LINE COUNT ===
+    if typography is not None:
+        # Advanced: Use character-width estimation
+        estimated_width = typography.estimate_text_width(clean_text, font_size)
+        available_width = textbox_width * (0.85 if is_subpoint else 0.95)
+        estimated_lines = max(1, math.ceil(estimated_width / available_width))
+    else:
+        # Simple: Character count estimation
+        estimated_width = 0
+        chars_per_line = chars_per_line * (0.8 if is_subpoint else 1.0)
+        estimated_lines = max(1, math.ceil(len(clean_text) / chars_per_line))
+    
+    # === CALCULATE HEIGHT ===
+    line_height = font_size * line_spacing
+    height_required = estimated_lines * line_height
+    
+    return ParagraphMetrics(
+        text=clean_text,
+        estimated_lines=estimated_lines,
+        actual_width=estimated_width,
+        height_required=height_required,
+        font_size=font_size,
+        is_subpoint=is_subpoint,
+        indent_level=indent_level
+    )
+
+
+def _greedy_breaks(offsets: List[float], para_spacing: float, threshold: float) -> List[int]:
+    """
+    First-fit slide breaks: each slide takes every following paragraph that
+    still fits, and always at least one.
+    
+    Args:
+        offsets: Prefix sums of (height + para_spacing), offsets[0] == 0
+        para_spacing: Spacing between paragraphs (points)
+        threshold: Usable textbox height (points)
+    
+    Returns:
+        Exclusive end index of each slide
+    """
+    ends = []
+    start, count = 0, len(offsets) - 1
+    while start < count:
+        start = bisect_right(offsets, offsets[start] + threshold + para_spacing, start + 2) - 1
+        ends.append(start)
+    return ends
+
+
+def _balanced_breaks(
+    offsets: List[float],
+    para_spacing: float,
+    threshold: float,
+    min_paragraphs: int = 1,
+    orphan_penalty: float = 0.0
+) -> List[int]:
+    """
+    Knuth–Plass style slide breaks minimizing Σ badness² over all slides.
+    
+    Algorithm:
+        badness(i, j) = (threshold - used(i, j)) / threshold
+        cost[j] = min over i < j of cost[i] + badness(i, j)² (+ penalties)
+    
+    Slides that would overflow are not considered, except a lone paragraph
+    taller than the textbox, which gets a slide to itself as in the greedy fill.
+    
+    Args:
+        offsets: Prefix sums of (height + para_spacing), offsets[0] == 0
+        para_spacing: Spacing between paragraphs (points)
+        threshold: Usable textbox height (points)
+        min_paragraphs: Slides with fewer paragraphs pay a penalty of 1.0
+        orphan_penalty: Extra cost for a lone paragraph on the last slide
+    
+    Returns:
+        Exclusive end index of each slide
+    """
+    count = len(offsets) - 1
+    cost = [0.0] + [math.inf] * count
+    back = [0] * (count + 1)
+    
+    for end in range(1, count + 1):
+        best, best_start = math.inf, end - 1
+        # Walk the slide's first paragraph backwards until it stops fitting
+        for start in range(end - 1, -1, -1):
+            used = offsets[end] - offsets[start] - para_spacing
+            if used > threshold and start < end - 1:
+                break
+            badness = max(0.0, threshold - used) / threshold
+            total = cost[start] + badness * badness
+            if end - start < min_paragraphs:
+                total += 1.0
+            if end == count and start > 0 and end - start == 1:
+                total += orphan_penalty
+            if total < best:
+                best, best_start = total, start
+        cost[end], back[end] = best, best_start
+    
+    ends = []
+    end = count
+    while end > 0:
+        ends.append(end)
+        end = back[end]
+    ends.reverse()
+    return ends
+
+
+def _paginate(
+    heights: List[float],
+    para_spacing: float,
+    threshold: float,
+    balanced: bool = True,
+    min_paragraphs: int = 1,
+    orphan_penalty: float = 0.0
+) -> List[int]:
+    """
+    Split paragraph heights into slides; the whole pagination step for a deck.
+    
+    Args:
+        heights: Height of each paragraph (points)
+        para_spacing: Spacing between paragraphs (points)
+        threshold: Usable textbox height (points)
+        balanced: Use the balanced DP breaks instead of the greedy fill
+        min_paragraphs: See _balanced_breaks
+        orphan_penalty: See _balanced_breaks
+    
+    Returns:
+        Exclusive end index of each slide
+    """
+    # offsets[k] = Σ(height + spacing) over paragraphs before k, so paragraphs
+    # i..j stacked on one slide need offsets[j + 1] - offsets[i] - spacing
+    offsets = list(accumulate((height + para_spacing for height in heights), initial=0.0))
+    if balanced:
+        return _balanced_breaks(offsets, para_spacing, threshold, min_paragraphs, orphan_penalty)
+    return _greedy_breaks(offsets, para_spacing, threshold)
+
+
 class SlideLayoutEngine:
     """
     🎯 ADVANCED DYNAMIC LAYOUT ENGINE
@@ -262,7 +471,7 @@ class SlideLayoutEngine:
        ├─> Track cumulative height incrementally
        ├─> Detect overflow conditions
        ├─> Apply adaptive spacing rules
-       ├─> Trigger pagination when needed
+       ├─> Choose slide breaks (greedy or balanced DP)
        └─> Prevent orphans/widows
        
     4. OPTIMIZATION
@@ -270,7 +479,6 @@ class SlideLayoutEngine:
        ├─> Vertical centering (top_padding calculation)
        ├─> Font size adjustment for slight overflows
        ├─> Spacing optimization (sparse/dense adaptation)
-       ├─> Balance content across slides
        └─> Final metrics validation
        
     5. OUTPUT
@@ -298,12 +506,13 @@ class SlideLayoutEngine:
         self.debug_log: List[str] = []
         self.metrics_history: List[Dict[str, Any]] = []
         
-        self._log(f"🚀 SlideLayoutEngine v2.0 Initialized")
-        self._log(f"   Textbox: {config.textbox_width:.1f}W × {config.textbox_height:.1f}H pts")
-        self._log(f"   Font: {config.font_family} {config.font_size}pt @ {config.line_spacing}× spacing")
-        self._log(f"   Features: {'✓' if config.auto_center_vertical else '✗'} Centering | "
-                 f"{'✓' if config.auto_adjust_font else '✗'} Auto-Font | "
-                 f"{'✓' if config.prevent_orphans else '✗'} Orphan Prevention")
+        if config.debug:
+            self._log(f"🚀 SlideLayoutEngine v2.0 Initialized")
+            self._log(f"   Textbox: {config.textbox_width:.1f}W × {config.textbox_height:.1f}H pts")
+            self._log(f"   Font: {config.font_family} {config.font_size}pt @ {config.line_spacing}× spacing")
+            self._log(f"   Features: {'✓' if config.auto_center_vertical else '✗'} Centering | "
+                     f"{'✓' if config.auto_adjust_font else '✗'} Auto-Font | "
+                     f"{'✓' if config.prevent_orphans else '✗'} Orphan Prevention")
     
     def calculate_layouts(
         self, 
@@ -331,17 +540,12 @@ class SlideLayoutEngine:
             FOR each paragraph p:
                 CALCULATE lines(p) using text metrics
                 CALCULATE height(p) = lines × line_height
-                TRACK cumulative_height += height(p) + spacing
-                
-                IF cumulative_height > threshold:
-                    FINALIZE current slide
-                    START new slide
-                    ADD p to new slide
-                ELSE:
-                    ADD p to current slide
             
-            FINALIZE last slide
-            APPLY optimizations to all slides
+            CHOOSE slide breaks over all heights (_paginate):
+                greedy: fill each slide until the next paragraph overflows
+                balanced: minimize Σ badness² over slides (Knuth–Plass DP)
+            
+            FINALIZE each slide (spacing, font, centering)
             RETURN layouts
         """
         if not paragraphs:
@@ -349,93 +553,78 @@ class SlideLayoutEngine:
             return []
         
         font_size = font_size or self.config.font_size
-        self._log(f"\n{'='*70}")
-        self._log(f"📊 CALCULATING LAYOUTS: {len(paragraphs)} paragraphs @ {font_size}pt")
-        self._log(f"{'='*70}")
+        # Debug messages are only formatted when someone will read them
+        debug = self.config.debug
+        if debug:
+            self._log(f"\n{'='*70}")
+            self._log(f"📊 CALCULATING LAYOUTS: {len(paragraphs)} paragraphs @ {font_size}pt")
+            self._log(f"{'='*70}")
         
         layouts: List[SlideLayout] = []
-        current_slide_paragraphs: List[str] = []
-        current_slide_metrics: List[ParagraphMetrics] = []
-        cumulative_height = 0.0
         
-        for para_idx, para_text in enumerate(paragraphs):
-            # === STEP 1: ANALYZE PARAGRAPH ===
-            metric = self._calculate_paragraph_metrics(para_text, font_size)
-            
-            # === STEP 2: ADD PARAGRAPH SPACING ===
-            # Add spacing before paragraph (except first on slide)
-            spacing_before = self.config.para_spacing if current_slide_paragraphs else 0
-            
-            # === STEP 3: CALCULATE PROJECTED HEIGHT ===
-            projected_height = cumulative_height + spacing_before + metric.height_required
-            
-            self._log(f"\n   Para {para_idx + 1}/{len(paragraphs)}: "
-                     f"{metric.estimated_lines} lines × {metric.height_required:.1f}pts")
-            self._log(f"      Text: \"{para_text[:60]}{'...' if len(para_text) > 60 else ''}\"")
-            self._log(f"      Cumulative: {cumulative_height:.1f} + {spacing_before:.1f} + "
-                     f"{metric.height_required:.1f} = {projected_height:.1f}pts")
+        # === STEP 1: ANALYZE ALL PARAGRAPHS ===
+        # Measured in one pass up front; pagination below only reads the results
+        all_metrics = [self._calculate_paragraph_metrics(para_text, font_size) for para_text in paragraphs]
+        heights = list(map(_HEIGHT_REQUIRED, all_metrics))
+        
+        # === STEP 2: CHOOSE SLIDE BREAKS ===
+        # One call per deck; balance_slides picks globally balanced breaks
+        # instead of filling each slide to the brim
+        para_spacing = self.config.para_spacing
+        overflow_threshold = self.config.textbox_height * self.config.overflow_threshold
+        slide_ends = _paginate(
+            heights, para_spacing, overflow_threshold,
+            balanced=self.config.balance_slides,
+            min_paragraphs=self.config.min_paragraphs_per_slide,
+            orphan_penalty=0.25 if self.config.prevent_orphans else 0.0
+        )
+        
+        start = 0
+        for end in slide_ends:
+            # Exact running height, summed in the same order as a per-paragraph fill
+            cumulative_height = heights[start]
+            for height in heights[start + 1:end]:
+                cumulative_height = cumulative_height + para_spacing + height
             
-            # === STEP 4: CHECK OVERFLOW ===
-            overflow_threshold = self.config.textbox_height * self.config.overflow_threshold
+            # === STEP 3: FINALIZE SLIDE ===
+            if debug:
+                self._log(f"\n   📄 Slide {len(layouts) + 1}: paragraphs {start + 1}-{end} of {len(paragraphs)}, "
+                         f"{cumulative_height:.1f}/{overflow_threshold:.1f}pts")
+                for para_idx in range(start, end):
+                    metric = all_metrics[para_idx]
+                    para_text = paragraphs[para_idx]
+                    self._log(f"      Para {para_idx + 1}: {metric.estimated_lines} lines × {metric.height_required:.1f}pts "
+                             f"\"{para_text[:60]}{'...' if len(para_text) > 60 else ''}\"")
+                if end < len(paragraphs):
+                    next_height = cumulative_height + para_spacing + heights[end]
+                    if next_height > overflow_threshold:
+                        self._log(f"      🔴 OVERFLOW: para {end + 1} would need "
+                                 f"{next_height:.1f} > {overflow_threshold:.1f}pts")
+                    else:
+                        self._log(f"      ⚖️  Balanced break before para {end + 1}")
+                    if self.config.prevent_orphans and end - start >= 2:
+                        self._log(f"      🛡️  Orphan prevention: keeping ≥2 paragraphs")
             
-            if projected_height > overflow_threshold and current_slide_paragraphs:
-                # === OVERFLOW DETECTED: FINALIZE CURRENT SLIDE ===
-                self._log(f"      🔴 OVERFLOW: {projected_height:.1f} > {overflow_threshold:.1f}")
-                self._log(f"      📄 Finalizing slide {len(layouts) + 1} with {len(current_slide_paragraphs)} paragraphs")
-                
-                # Check orphan prevention
-                if self.config.prevent_orphans and len(current_slide_paragraphs) >= 2:
-                    # Keep at least 2 paragraphs on current slide
-                    self._log(f"      🛡️  Orphan prevention: keeping ≥2 paragraphs")
-                
-                layout = self._finalize_slide_layout(
-                    slide_number=len(layouts),
-                    paragraphs=current_slide_paragraphs,
-                    metrics=current_slide_metrics,
-                    cumulative_height=cumulative_height,
-                    base_font_size=font_size
-                )
-                layouts.append(layout)
-                
-                # === START NEW SLIDE ===
-                current_slide_paragraphs = [para_text]
-                current_slide_metrics = [metric]
-                cumulative_height = metric.height_required
-                self._log(f"      ✨ Starting slide {len(layouts) + 1} with para {para_idx + 1}")
-            
-            else:
-                # === ADD TO CURRENT SLIDE ===
-                current_slide_paragraphs.append(para_text)
-                current_slide_metrics.append(metric)
-                cumulative_height = projected_height
-                self._log(f"      ✅ Added to current slide ({len(current_slide_paragraphs)} total)")
-        
-        # === STEP 5: FINALIZE LAST SLIDE ===
-        if current_slide_paragraphs:
-            self._log(f"\n   📄 Finalizing final slide {len(layouts) + 1} with {len(current_slide_paragraphs)} paragraphs")
             layout = self._finalize_slide_layout(
                 slide_number=len(layouts),
-                paragraphs=current_slide_paragraphs,
-                metrics=current_slide_metrics,
+                paragraphs=paragraphs[start:end],
+                metrics=all_metrics[start:end],
                 cumulative_height=cumulative_height,
                 base_font_size=font_size
             )
             layouts.append(layout)
-        
-        # === STEP 6: POST-PROCESSING OPTIMIZATION ===
-        if self.config.balance_slides and len(layouts) > 1:
-            self._log(f"\n   ⚖️  Balancing content across {len(layouts)} slides...")
-            layouts = self._balance_slides(layouts)
+            start = end
         
         # === SUMMARY ===
-        self._log(f"\n{'='*70}")
-        self._log(f"✅ LAYOUT COMPLETE: {len(layouts)} slide(s) created")
-        for idx, layout in enumerate(layouts):
-            self._log(f"   Slide {idx + 1}: {len(layout.paragraphs)} para, "
-                     f"{layout.utilization_ratio:.1%} util, "
-                     f"{layout.density.value} density, "
-                     f"{'✓ optimal' if layout.is_optimal else '⚠ suboptimal'}")
-        self._log(f"{'='*70}\n")
+        if debug:
+            self._log(f"\n{'='*70}")
+            self._log(f"✅ LAYOUT COMPLETE: {len(layouts)} slide(s) created")
+            for idx, layout in enumerate(layouts):
+                self._log(f"   Slide {idx + 1}: {len(layout.paragraphs)} para, "
+                         f"{layout.utilization_ratio:.1%} util, "
+                         f"{layout.density.value} density, "
+                         f"{'✓ optimal' if layout.is_optimal else '⚠ suboptimal'}")
+            self._log(f"{'='*70}\n")
         
         return layouts
     
@@ -457,35 +646,18 @@ class SlideLayoutEngine:
                 lines = ceil(len(text) / chars_per_line)
             
             height = lines × (font_size × line_spacing)
-        """
-        # Detect indentation level
-        is_subpoint = text.startswith('  ')
-        indent_level = len(text) - len(text.lstrip())
-        clean_text = text.strip()
         
-        # === ESTIMATE LINE COUNT ===
-        if self.config.use_advanced_metrics and self.typography:
-            # Advanced: Use character-width estimation
-            estimated_width = self.typography.estimate_text_width(clean_text, font_size)
-            available_width = self.config.textbox_width * (0.85 if is_subpoint else 0.95)
-            estimated_lines = max(1, math.ceil(estimated_width / available_width))
-        else:
-            # Simple: Character count estimation
-            chars_per_line = self.config.chars_per_line * (0.8 if is_subpoint else 1.0)
-            estimated_lines = max(1, math.ceil(len(clean_text) / chars_per_line))
-        
-        # === CALCULATE HEIGHT ===
-        line_height = font_size * self.config.line_spacing
-        height_required = estimated_lines * line_height
-        
-        return ParagraphMetrics(
-            text=clean_text,
-            estimated_lines=estimated_lines,
-            actual_width=estimated_width if self.config.use_advanced_metrics else 0,
-            height_required=height_required,
-            font_size=font_size,
-            is_subpoint=is_subpoint,
-            indent_level=indent_level
+        Results are memoized (see _measure_paragraph), so re-measuring the
+        same bullets, e.g. when a deck is rebuilt, is a cache lookup.
+        """
+        config = self.config
+        return _measure_paragraph(
+            text,
+            font_size,
+            self.typography if config.use_advanced_metrics else None,
+            config.textbox_width,
+            config.chars_per_line,
+            config.line_spacing
         )
     
     def _finalize_slide_layout(
@@ -512,10 +684,12 @@ class SlideLayoutEngine:
         para_spacing = self.config.para_spacing
         font_size = base_font_size
         optimization = "none"
+        debug = self.config.debug
         
         # === DENSITY ANALYSIS ===
         density = self._classify_density(len(paragraphs), cumulative_height, available_height)
-        self._log(f"      📊 Density: {density.value}")
+        if debug:
+            self._log(f"      📊 Density: {density.value}")
         
         # === FONT SIZE ADJUSTMENT ===
         if self.config.auto_adjust_font:
@@ -529,27 +703,28 @@ class SlideLayoutEngine:
                 
                 # Recalculate metrics with new font size
                 metrics = [self._calculate_paragraph_metrics(p, font_size) for p in paragraphs]
-                cumulative_height = sum(m.height_required for m in metrics)
-                cumulative_height += para_spacing * (len(paragraphs) - 1)
                 
                 optimization = f"font_reduced_{int((1-reduction_factor)*100)}pct"
-                self._log(f"      🎯 Font adjusted: {base_font_size:.1f} → {font_size:.1f}pt "
-                         f"({reduction_factor:.1%})")
+                if debug:
+                    self._log(f"      🎯 Font adjusted: {base_font_size:.1f} → {font_size:.1f}pt "
+                             f"({reduction_factor:.1%})")
         
         # === ADAPTIVE SPACING ===
         if self.config.optimize_spacing:
             if density == ContentDensity.SPARSE:
                 para_spacing *= self.config.sparse_content_multiplier
                 optimization = optimization + "+sparse_spacing" if optimization != "none" else "sparse_spacing"
-                self._log(f"      🎨 Sparse spacing: {self.config.para_spacing:.1f} → {para_spacing:.1f}pts")
+                if debug:
+                    self._log(f"      🎨 Sparse spacing: {self.config.para_spacing:.1f} → {para_spacing:.1f}pts")
             
             elif density == ContentDensity.DENSE or density == ContentDensity.OVERCROWDED:
                 para_spacing *= self.config.dense_content_multiplier
                 optimization = optimization + "+dense_spacing" if optimization != "none" else "dense_spacing"
-                self._log(f"      🎨 Dense spacing: {self.config.para_spacing:.1f} → {para_spacing:.1f}pts")
+                if debug:
+                    self._log(f"      🎨 Dense spacing: {self.config.para_spacing:.1f} → {para_spacing:.1f}pts")
         
         # === RECALCULATE WITH ADJUSTED SPACING ===
-        total_height_used = sum(m.height_required for m in metrics)
+        total_height_used = sum(map(_HEIGHT_REQUIRED, metrics))
         total_height_used += para_spacing * (len(paragraphs) - 1)
         
         # === VERTICAL CENTERING ===
@@ -558,7 +733,8 @@ class SlideLayoutEngine:
             remaining_space = available_height - total_height_used
             if remaining_space > 0:
                 top_padding = remaining_space / 2
-                self._log(f"      📐 Vertical centering: {top_padding:.1f}pts top padding")
+                if debug:
+                    self._log(f"      📐 Vertical centering: {top_padding:.1f}pts top padding")
         
         # === CREATE LAYOUT ===
         is_balanced = 0.60 <= (total_height_used / available_height) <= 0.95
@@ -579,8 +755,9 @@ class SlideLayoutEngine:
             optimization_applied=optimization
         )
         
-        self._log(f"      📊 Final metrics: {total_height_used:.1f}/{available_height:.1f}pts "
-                 f"({layout.utilization_ratio:.1%} util)")
+        if debug:
+            self._log(f"      📊 Final metrics: {total_height_used:.1f}/{available_height:.1f}pts "
+                     f"({layout.utilization_ratio:.1%} util)")
         
         return layout
     
@@ -610,20 +787,10 @@ class SlideLayoutEngine:
         else:
             return ContentDensity.BALANCED
     
-    def _balance_slides(self, layouts: List[SlideLayout]) -> List[SlideLayout]:
-        """
-        Balance content distribution across multiple slides.
-        
-        Attempts to redistribute paragraphs for more even utilization.
-        
-        NOTE: This is a placeholder for future advanced balancing logic.
-        """
-        # TODO: Implement sophisticated balancing algorithm
-        # For now, just return as-is
-        return layouts
-    
     def _log(self, message: str):
-        """Add message to debug log."""
+        """Add message to debug log (no-op unless config.debug is set)."""
+        if not self.config.debug:
+            return
         self.debug_log.append(message)
     
     def get_debug_log(self) -> List[str]: